@@ -7,13 +7,16 @@ import re
 import logging
 import asyncio
 import random
-import unicodedata
 from typing import Dict, Any, Optional, List, AsyncGenerator, Tuple
 from datetime import datetime
 import openai
 from openai import AsyncOpenAI
 import httpx
 
+from color_families import color_families, normalize_color, query_family
+from search_index import normalize_name
+from text_matching import PhraseMatcher
+
 logger = logging.getLogger("AIVA.AI")
 
 # ✅ SYSTEM PROMPT OTTIMIZZATO
@@ -159,23 +162,16 @@ CATEGORY_SYNONYMS = {
     "borse": "accessori",
 }
 
+_CATEGORY_MATCHER = PhraseMatcher(CATEGORY_SYNONYMS)
 
-def detect_category_from_text(text_lower: str) -> Optional[Tuple[str, str]]:
-    """Return (canonical, matched_phrase) if a known category is mentioned."""
+# Similarity bonus for products on screen when resolving spoken names
+VISIBLE_NAME_BONUS = 0.1
 
-    matched_phrase = ""
-    matched_category: Optional[str] = None
 
-    for phrase, canonical in CATEGORY_SYNONYMS.items():
-        if not phrase:
-            continue
-        if phrase in text_lower and len(phrase) >= len(matched_phrase):
-            matched_phrase = phrase
-            matched_category = canonical
+def detect_category_from_text(text_lower: str) -> Optional[Tuple[str, str]]:
+    """Return (canonical, matched_phrase) if a known category is mentioned."""
 
-    if matched_category:
-        return matched_category, matched_phrase
-    return None
+    return _CATEGORY_MATCHER.longest_match(text_lower)
 
 class SecureAIService:
     """Enhanced AI service with Italian support and improved function execution"""
@@ -436,14 +432,47 @@ class SecureAIService:
 
         return preferences
 
+    @staticmethod
+    def resolve_product_name(
+        requested: Optional[str],
+        visible: Optional[List[Dict[str, Any]]] = None,
+        visible_map: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Resolve a spoken product name to a product id.
+
+        Exact (normalized) names of the visible products win; otherwise the
+        closest catalog names from the trigram name index are used, with a
+        small bonus for products currently on screen; a full-text search is
+        the last resort.
+        """
+        from app import data_store
+
+        key = normalize_name(requested)
+        if not key:
+            return None
+
+        visible = visible or []
+        exact = {normalize_name(name): pid for name, pid in (visible_map or {}).items()}
+        for p in visible:
+            if p.get("name") and p.get("id"):
+                exact.setdefault(normalize_name(p["name"]), p["id"])
+        if key in exact:
+            return exact[key]
+
+        visible_ids = {p.get("id") for p in visible}
+        matches = data_store.match_product_names(key, limit=5)
+        if matches:
+            best, _ = max(
+                matches,
+                key=lambda match: match[1] + (VISIBLE_NAME_BONUS if match[0].id in visible_ids else 0.0))
+            return best.id
+
+        results = data_store.search_products(query=requested, limit=1)
+        return results[0].id if results else None
+
     @staticmethod
     def _normalize_color_name(value: Optional[str]) -> str:
-        if not value:
-            return ""
-        normalized = unicodedata.normalize("NFKD", value)
-        normalized = normalized.encode("ascii", "ignore").decode("ascii")
-        normalized = re.sub(r"[^a-z0-9]+", " ", normalized.lower()).strip()
-        return normalized
+        # Memoized: the same handful of color names recur on every request
+        return normalize_color(value)
 
     @staticmethod
     def _word_to_number(token: Optional[str]) -> Optional[int]:
@@ -513,6 +542,9 @@ class SecureAIService:
 
         variant_lookup: Dict[Tuple[str, str], Dict[str, Any]] = {}
         color_lookup: Dict[str, str] = {}
+        # Color family -> the product's color in it; None when several
+        # colors share the family ("blu navy" and "blu notte")
+        family_lookup: Dict[str, Optional[str]] = {}
 
         for variant in variants:
             size_value = str(variant.get("size", "")).upper()
@@ -520,8 +552,10 @@ class SecureAIService:
             norm_color = self._normalize_color_name(color_value)
             if size_value and norm_color:
                 variant_lookup[(size_value, norm_color)] = variant
-            if norm_color and color_value:
-                color_lookup.setdefault(norm_color, color_value)
+            if norm_color and color_value and norm_color not in color_lookup:
+                color_lookup[norm_color] = color_value
+                for family in color_families(color_value, variant.get("color_code")):
+                    family_lookup[family] = None if family in family_lookup else color_value
 
         available_colors = [
             color for color in (product_context.get("available_colors") or [])
@@ -549,6 +583,11 @@ class SecureAIService:
 
             norm_color = self._normalize_color_name(raw_color)
             resolved_color = color_lookup.get(norm_color) if norm_color else None
+            if not resolved_color and norm_color:
+                # "nera" for "Nero", "grigio" for "Grigio melange"
+                resolved_color = family_lookup.get(query_family(norm_color) or "")
+                if resolved_color:
+                    norm_color = self._normalize_color_name(resolved_color)
 
             if not resolved_color:
                 if not norm_color and len(set(available_colors)) == 1:
@@ -593,12 +632,6 @@ class SecureAIService:
         """Process voice command with streaming response"""
         
         # ✅ Intent robusto: “apri la pagina prodotto <nome>” prima del modello
-        import re
-        from difflib import get_close_matches
-
-        def _norm(s: str) -> str:
-            return re.sub(r"[^a-z0-9 ]", "", (s or "").lower()).strip()
-
         text_lower = (text or "").lower().strip()
         vp_map = context.get("visible_products_map") or {}
         visible = context.get("visible_products") or []
@@ -608,29 +641,8 @@ class SecureAIService:
         requested = (m.group(2).strip() if m else None)
 
         if any(k in text_lower for k in ["apri", "aprimi", "apri la pagina", "pagina prodotto"]) and requested:
-            # 1) match diretto sulla mappa normalizzata
-            cand = None
-            if vp_map:
-                key = _norm(requested)
-                if key in vp_map:
-                    cand = vp_map[key]
-
-            # 2) fuzzy sui visibili
-            if not cand and visible:
-                names = [p["name"] for p in visible if p.get("name")]
-                match = get_close_matches(requested, [n.lower() for n in names], n=1, cutoff=0.6)
-                if match:
-                    target = match[0]
-                    for p in visible:
-                        if p.get("name", "").lower() == target:
-                            cand = p["id"]; break
-
-            # 3) fallback: cerca nel catalogo
-            if not cand:
-                from app import data_store
-                results = data_store.search_products(query=requested, limit=1)
-                if results:
-                    cand = results[0].id
+            # Nome esatto tra i visibili → trigrammi su tutto il catalogo → ricerca
+            cand = self.resolve_product_name(requested, visible, vp_map)
 
             if cand:
                 yield {"type": "function_start", "function": "get_product_details"}
@@ -654,12 +666,6 @@ class SecureAIService:
             return
         
         # 🔎 Shortcuts basati sul contesto UI (prima di chiamare il modello)
-        import re
-        from difflib import get_close_matches
-
-        def norm(s: str) -> str:
-            return re.sub(r"[^a-z0-9 ]", "", (s or "").lower()).strip()
-
         text_lower = (text or "").lower().strip()
         cp = context.get("current_product")
         visible = context.get("visible_products", [])
@@ -790,27 +796,7 @@ class SecureAIService:
             if m:
                 target_name = m.group(2).strip()
 
-            from app import data_store
-            candidate = None
-            # 1) match esatto su visibili
-            if target_name and visible:
-                vis_names = {p["name"]: p["id"] for p in visible}
-                for name, pid in vis_names.items():
-                    if norm(name) == norm(target_name):
-                        candidate = pid; break
-            # 2) fuzzy su visibili
-            if not candidate and target_name and visible:
-                names = [p["name"] for p in visible]
-                match = get_close_matches(target_name, names, n=1, cutoff=0.6)
-                if match:
-                    for p in visible:
-                        if p["name"] == match[0]:
-                            candidate = p["id"]; break
-            # 3) fallback: cerca nel catalogo
-            if not candidate:
-                results = data_store.search_products(query=target_name or text_lower, limit=1)
-                if results:
-                    candidate = results[0].id
+            candidate = self.resolve_product_name(target_name or text_lower, visible)
 
             if candidate:
                 yield {"type": "function_complete", "function": "get_product_details",
@@ -16,11 +16,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import pydantic
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any, Set, Tuple
+from typing import Optional, List, Dict, Any, FrozenSet, Iterable, Set, Tuple
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 import hashlib
+import hmac
 import json
 import uuid
 import re
@@ -28,12 +30,37 @@ import os
 import httpx
 import logging
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 import asyncio
+import copy
+import itertools
 from enum import Enum
 
+import numpy as np
+
+from catalog_columns import CatalogColumns
+from catalog_loader import load_catalog
+from catalog_views import CatalogViews
+from compression import CompressionMiddleware
+from http_cache import (
+    DefaultJSONResponse,
+    PreparedJSON,
+    SerializedModels,
+    accepted_encoding,
+    catalog_etag,
+    etag_matches,
+    json_array,
+    json_bytes,
+    json_response,
+    not_modified)
+from pagination import CursorError, PageCursor, StaleCursorError, query_fingerprint
+from recommendations import RecommendationTable
+from search_cache import QueryResultCache
+from search_index import NameIndex, SearchDocument, SearchIndex, normalize_name
 from speech_service import transcribe_pcm16
+from text_matching import PhraseMatcher
 from tts_service import synthesize_speech
+from vector_search import VectorIndex
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -75,11 +102,27 @@ if origin_regex_env and origin_regex_env.lower() in {"0", "false", "none"}:
 else:
     _allowed_origin_regex = origin_regex_env or r"https://.*\.vercel\.app"
 
-API_KEY = os.getenv("API_KEY", "demo-key-for-development")
+DEFAULT_API_KEY = "demo-key-for-development"
+API_KEY = os.getenv("API_KEY", DEFAULT_API_KEY)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 MAX_REQUESTS_PER_MINUTE = 60
 MAX_AI_REQUESTS_PER_MINUTE = 10
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "512"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+# Memory budget of the cached results of one catalog snapshot
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(64 * 2**20)))
+# Pages of /api/products results ranked (and cached) past the requested one
+SEARCH_PAGE_WINDOW = int(os.getenv("SEARCH_PAGE_WINDOW", "5"))
+# Minimum cosine similarity for vector fallback matches of unmatched queries
+VECTOR_MIN_SCORE = float(os.getenv("VECTOR_MIN_SCORE", "0.16"))
 SESSION_COOKIE_NAME = "aiva_session_id"
+# Identifies this process in the revision of catalogs changed in memory
+CATALOG_EPOCH = uuid.uuid4().hex[:8]
+# Catalog responses: browsers revalidate every time (cheap 304s), a CDN may
+# serve them for a minute and refresh in the background
+CATALOG_CACHE_CONTROL = os.getenv(
+    "CATALOG_CACHE_CONTROL", "public, max-age=0, s-maxage=60, stale-while-revalidate=300"
+)
 
 
 def resolve_session_id(
@@ -112,7 +155,8 @@ app = FastAPI(
     version="2.0.0",
     description="Secure voice-enabled Italian fashion e-commerce backend",
     docs_url="/api/docs",
-    redoc_url="/api/redoc")
+    redoc_url="/api/redoc",
+    default_response_class=DefaultJSONResponse)
 
 # CORS Configuration
 cors_kwargs: Dict[str, Any] = {
@@ -120,6 +164,7 @@ cors_kwargs: Dict[str, Any] = {
     "allow_credentials": True,
     "allow_methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     "allow_headers": ["*"],
+    "expose_headers": ["X-Total-Count", "X-Next-Cursor", "X-Catalog-Version", "ETag"],
 }
 
 if _allowed_origin_regex:
@@ -131,6 +176,8 @@ logger.info(
     cors_kwargs.get("allow_origin_regex"))
 
 app.add_middleware(CORSMiddleware, **cors_kwargs)
+# gzip/brotli for JSON above COMPRESSION_MIN_SIZE; precompressed payloads pass through
+app.add_middleware(CompressionMiddleware)
 
 # Static files (for serving images in production/dev)
 STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
@@ -170,6 +217,34 @@ def build_image_url(path: str) -> str:
     return f"{base}/{rel}"
 
 
+# Catalog source (JSON) and its validated binary snapshot
+CATALOG_PATH = os.getenv(
+    "CATALOG_PATH", os.path.join(os.path.dirname(__file__), "data", "catalog.json")
+)
+CATALOG_SNAPSHOT_PATH = os.getenv(
+    "CATALOG_SNAPSHOT_PATH",
+    os.path.join(os.path.dirname(__file__), "data", "catalog.snapshot"))
+
+
+# Bump whenever DataStore.build_catalog_products changes what it produces
+CATALOG_BUILD_VERSION = 2
+
+
+@lru_cache(maxsize=1)
+def catalog_snapshot_salt() -> str:
+    """Build inputs, besides the JSON source, that shape the pickled models:
+    the builder version, the pydantic version and the ``Product`` schema.
+
+    Deployment settings (the assets base URL) are applied after loading, so
+    one snapshot is valid in every environment.
+    """
+    schema = json.dumps(Product.model_json_schema(), sort_keys=True)
+    return (
+        f"build={CATALOG_BUILD_VERSION};pydantic={pydantic.VERSION};"
+        f"schema={hashlib.sha256(schema.encode('utf-8')).hexdigest()[:16]}"
+    )
+
+
 # ============================================================================
 # ENUMS AND CONSTANTS
 # ============================================================================
@@ -204,6 +279,20 @@ class ProductCategory(str, Enum):
     ACCESSORI = "accessori"
 
 
+class ProductSort(str, Enum):
+    RELEVANCE = "relevance"
+    PRICE_ASC = "price_asc"
+    PRICE_DESC = "price_desc"
+    POPULAR = "popular"
+    DISCOUNT = "discount"
+    NEWEST = "newest"
+
+
+class RecommendationMode(str, Enum):
+    OUTFIT = "outfit"  # complementary items, then similar ones (precomputed)
+    SIMILAR = "similar"  # "more like this" by text vector similarity
+
+
 # Italian synonyms mapping for natural language understanding
 SYNONYM_MAP = {
     "maglia": "t-shirt",
@@ -251,6 +340,8 @@ SYNONYM_MAP = {
     "zaino": "accessori",
 }
 
+_SYNONYM_MATCHER = PhraseMatcher(SYNONYM_MAP)
+
 # ============================================================================
 # SECURITY LAYER
 # ============================================================================
@@ -294,13 +385,30 @@ def sanitize_input(text: str, max_length: int = 500) -> str:
     return text.strip()
 
 
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def require_api_key(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)) -> None:
+    """Protect admin endpoints with the API_KEY bearer token.
+
+    Without a real key (unset or the public demo default) the admin endpoints
+    do not exist: anyone could otherwise trigger catalog rebuilds.
+    """
+    if not API_KEY or API_KEY == DEFAULT_API_KEY:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode("utf-8"), API_KEY.encode("utf-8")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Non autorizzato",
+            headers={"WWW-Authenticate": "Bearer"})
+
+
 def normalize_italian_terms(text: str) -> str:
-    """Normalize Italian terms to standard categories"""
-    text_lower = text.lower()
-    for synonym, category in SYNONYM_MAP.items():
-        if synonym in text_lower:
-            text_lower = text_lower.replace(synonym, category)
-    return text_lower
+    """Normalize Italian terms to standard categories (single pass, longest match)"""
+    return _SYNONYM_MATCHER.replace(text.lower())
 
 
 # ============================================================================
@@ -339,6 +447,55 @@ class Product(BaseModel):
     tags: List[str]  # for search optimization
 
 
+# Named field projections for ``fields=``: ``card`` is what a product grid
+# renders, ``detail`` the full product page
+PRODUCT_PROJECTIONS: Dict[str, Tuple[str, ...]] = {
+    "card": (
+        "id",
+        "name",
+        "brand",
+        "category",
+        "price",
+        "original_price",
+        "discount_percentage",
+        "on_sale",
+        "images",
+        "rating",
+        "reviews",
+    ),
+    "detail": tuple(Product.model_fields),
+}
+# Ad-hoc field lists kept pre-serialized per snapshot; further ones are
+# serialized per request
+PROJECTION_CACHE_SIZE = 16
+# Most ids resolved by one /api/products/batch request (mirrored in the
+# frontend services/api.js, which splits longer lists)
+PRODUCT_BATCH_LIMIT = 100
+
+
+def parse_product_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Field projection of a ``fields=`` parameter (None: the full product).
+
+    Accepts comma-separated field names and/or projection names
+    (``fields=card,description``); ``id`` is always included.
+    """
+    if not fields or not fields.strip():
+        return None
+    selected = {"id"}
+    for name in (part.strip() for part in fields.split(",")):
+        if not name:
+            continue
+        if name in PRODUCT_PROJECTIONS:
+            selected.update(PRODUCT_PROJECTIONS[name])
+        elif name in Product.model_fields:
+            selected.add(name)
+        else:
+            raise ValueError(name)
+    if len(selected) == len(Product.model_fields):
+        return None
+    return frozenset(selected)
+
+
 class CartItem(BaseModel):
     id: str
     product_id: str
@@ -358,28 +515,51 @@ class Cart(BaseModel):
     grand_total: float = 0.0
 
 
+def visible_products_context(product_ids: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Compact summaries of the products on screen (first 24 ids) for the AI,
+    resolved in one batch lookup"""
+    ids = [pid for pid in (product_ids or [])[:24] if isinstance(pid, str)]
+    products, _ = data_store.get_products_by_ids(ids)
+    return [
+        {
+            "id": p.id,
+            "name": p.name,
+            "category": p.category,
+            "gender": p.gender,
+            "price": p.price,
+            "on_sale": p.on_sale,
+            "discount": p.discount_percentage,
+        }
+        for p in products
+    ]
+
+
 def serialize_product_for_ai(product: Product) -> Dict[str, Any]:
     """Return a compact snapshot with descriptive details but without stock counts."""
 
     try:
-        available_sizes = []
-        available_colors = []
-        variant_pairs = []
-
-        for variant in product.variants:
-            pair = {
+        variant_pairs = [
+            {
                 "size": variant.size,
                 "color": variant.color,
                 "available": variant.available,
             }
-            variant_pairs.append(pair)
+            for variant in product.variants
+        ]
 
-            if variant.available:
-                if variant.size not in available_sizes:
-                    available_sizes.append(variant.size)
-                normalized_color = variant.color
-                if normalized_color not in available_colors:
-                    available_colors.append(normalized_color)
+        # Read stock from the catalog bitsets; loop only for foreign products
+        options = data_store.available_options(product.id)
+        if options is not None:
+            available_sizes, available_colors = options
+        else:
+            available_sizes = []
+            available_colors = []
+            for variant in product.variants:
+                if variant.available:
+                    if variant.size not in available_sizes:
+                        available_sizes.append(variant.size)
+                    if variant.color not in available_colors:
+                        available_colors.append(variant.color)
 
         return {
             "id": product.id,
@@ -444,6 +624,11 @@ class AddToCartRequest(BaseModel):
     session_id: Optional[str] = None
 
 
+class ProductBatchRequest(BaseModel):
+    ids: List[str] = Field(max_length=PRODUCT_BATCH_LIMIT)
+    fields: Optional[str] = None
+
+
 class VoiceRequest(BaseModel):
     text: str = Field(max_length=500)
     context: Optional[Dict[str, Any]] = {}
@@ -494,16 +679,260 @@ class SearchFilters(BaseModel):
 # ============================================================================
 
 
+class CatalogSnapshot:
+    """Immutable catalog state: the products plus every structure derived from them.
+
+    Readers take ``data_store.catalog`` once and work on that object for the
+    whole request; writers build a new snapshot and swap the reference
+    (copy-on-write), so requests in flight keep a consistent view without
+    locking. Snapshots are never mutated after publication.
+    """
+
+    def __init__(
+        self,
+        products: List[Product],
+        version: int = 1,
+        documents: Optional[List[SearchDocument]] = None,
+        source: Optional[str] = None):
+        self.version = version
+        self.revision = self.build_revision(version, source)
+        self.products: Tuple[Product, ...] = tuple(products)
+        if documents is None:
+            documents = [self.build_search_document(product) for product in self.products]
+        self.search_documents: Tuple[SearchDocument, ...] = tuple(documents)
+
+        self.search_index = SearchIndex()
+        self.name_index = NameIndex()
+        self.positions_by_id: Dict[str, int] = {}
+        # (product id, size, lower-cased color) -> (position, index in variants);
+        # indexes stay valid when stock changes copy the variants
+        self.variants_by_key: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+        for position, product in enumerate(self.products):
+            self.search_index.add(position, self.search_documents[position])
+            self.name_index.add(position, product.name)
+            self.positions_by_id[product.id] = position
+            for index, variant in enumerate(product.variants):
+                self.variants_by_key.setdefault(
+                    self.variant_key(product.id, variant.size.value, variant.color),
+                    (position, index))
+        self.columns = CatalogColumns(
+            self.products, sizes=[size.value for size in Size]
+        )
+        self.recommendations = RecommendationTable(self.columns)
+        self.views = CatalogViews(self.products, self.columns)
+        self.vectors = VectorIndex(
+            [self.build_vector_text(product) for product in self.products]
+        )
+        # Response bytes of each product, serialized on first request; field
+        # projections keep their own payloads
+        self.payloads = SerializedModels(self.products)
+        card = frozenset(PRODUCT_PROJECTIONS["card"])
+        self.projections: Dict[FrozenSet[str], SerializedModels] = {
+            card: SerializedModels(self.products, include=card)
+        }
+        # Cache keys embed the version; each snapshot starts with its own cache
+        self.search_cache = QueryResultCache(
+            maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL, maxbytes=SEARCH_CACHE_MAX_BYTES
+        )
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    @staticmethod
+    def variant_key(product_id: str, size: str, color: str) -> Tuple[str, str, str]:
+        return product_id, size, color.lower()
+
+    @staticmethod
+    def build_revision(version: int, source: Optional[str] = None) -> str:
+        """Catalog identity that stays valid across restarts and instances.
+
+        A catalog loaded as is from its source is identified by the source
+        fingerprint, the same in every process. Catalogs changed in memory
+        (or built from given products) are only known to this process: the
+        process epoch plus the version counter.
+        """
+        if source is not None:
+            return source
+        return f"{CATALOG_EPOCH}.{version}"
+
+    def payloads_for(self, fields: Optional[FrozenSet[str]] = None) -> SerializedModels:
+        """Payload cache of a field projection (None: full products)"""
+        if fields is None:
+            return self.payloads
+        payloads = self.projections.get(fields)
+        if payloads is None:
+            payloads = SerializedModels(self.products, include=fields)
+            if len(self.projections) < PROJECTION_CACHE_SIZE:
+                self.projections[fields] = payloads
+        return payloads
+
+    def product_json(
+        self, product: Product, fields: Optional[FrozenSet[str]] = None
+    ) -> bytes:
+        """JSON bytes of ``product`` (projected to ``fields``), from the payload
+        cache when it belongs to this snapshot"""
+        position = self.positions_by_id.get(product.id)
+        if position is not None and self.products[position] is product:
+            return self.payloads_for(fields)[position]
+        return product.model_dump_json(include=fields).encode("utf-8")
+
+    @staticmethod
+    def build_search_document(product: Product) -> SearchDocument:
+        """Normalize the searchable text of a product once, field by field"""
+        fields = {
+            "name": normalize_italian_terms(f"{product.name} {product.brand}"),
+            "tags": normalize_italian_terms(
+                f"{product.category.value} {product.subcategory} {' '.join(product.tags)}"
+            ),
+            "description": normalize_italian_terms(product.description),
+            "raw_tags": " ".join(product.tags).lower(),
+        }
+        return SearchDocument(
+            fields={name: tuple(text.split()) for name, text in fields.items()}
+        )
+
+    @staticmethod
+    def build_vector_text(product: Product) -> str:
+        """Raw (not synonym-folded) text for the similarity vectors, so brand
+        words like "sneakers" or "jeans" keep their own character n-grams"""
+        return normalize_name(
+            f"{product.name} {product.brand} {product.category.value} "
+            f"{product.subcategory} {' '.join(product.tags)}"
+        )
+
+    def with_product(self, product: Product, version: int) -> "CatalogSnapshot":
+        """New snapshot with ``product`` added or replaced (documents of the
+        other products are reused)"""
+        products = list(self.products)
+        documents = list(self.search_documents)
+        document = self.build_search_document(product)
+        position = self.positions_by_id.get(product.id)
+        if position is not None:
+            products[position] = product
+            documents[position] = document
+        else:
+            products.append(product)
+            documents.append(document)
+        return CatalogSnapshot(products, version=version, documents=documents)
+
+    def with_stock(
+        self, changes: List[Tuple[int, str, str, bool]], version: int
+    ) -> "CatalogSnapshot":
+        """New snapshot with variant stock flags changed.
+
+        Only the stock bitsets and the touched products (and their cached
+        payloads) are copied; the
+        search, name and vector indexes, the views and the other columns are
+        shared.
+        """
+        snapshot = copy.copy(self)
+        snapshot.version = version
+        snapshot.revision = self.build_revision(version)
+        snapshot.columns = self.columns.with_stock(changes)
+        products = list(self.products)
+        touched = {change[0] for change in changes}
+        for position in touched:
+            product = products[position]
+            variants = [
+                variant.model_copy(
+                    update={
+                        "available": snapshot.columns.is_available(
+                            position, variant.size.value, variant.color
+                        )
+                    }
+                )
+                for variant in product.variants
+            ]
+            products[position] = product.model_copy(update={"variants": variants})
+        snapshot.products = tuple(products)
+        snapshot.payloads = self.payloads.replaced(snapshot.products, touched)
+        snapshot.projections = {
+            fields: payloads.replaced(snapshot.products, touched)
+            for fields, payloads in self.projections.items()
+        }
+        snapshot.search_cache = QueryResultCache(
+            maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL, maxbytes=SEARCH_CACHE_MAX_BYTES
+        )
+        return snapshot
+
+
 class DataStore:
     """In-memory data store for fashion e-commerce demo"""
 
-    def __init__(self):
-        self.products = self._load_fashion_catalog()
+    SIZE_GUIDES: Dict[str, Dict[str, Dict[str, str]]] = {
+        "tshirt": {
+            "uomo": {
+                "XS": "44-46",
+                "S": "46-48",
+                "M": "48-50",
+                "L": "50-52",
+                "XL": "52-54",
+                "XXL": "54-56",
+            },
+            "donna": {
+                "XS": "38-40",
+                "S": "40-42",
+                "M": "42-44",
+                "L": "44-46",
+                "XL": "46-48",
+                "XXL": "48-50",
+            },
+        },
+        "pantaloni": {
+            "uomo": {
+                "XS": "44",
+                "S": "46",
+                "M": "48",
+                "L": "50",
+                "XL": "52",
+                "XXL": "54",
+            },
+            "donna": {
+                "XS": "38",
+                "S": "40",
+                "M": "42",
+                "L": "44",
+                "XL": "46",
+                "XXL": "48",
+            },
+        },
+        "scarpe": {
+            "uomo": {"S": "39-40", "M": "41-42", "L": "43-44", "XL": "45-46"},
+            "donna": {"XS": "35-36", "S": "37-38", "M": "39-40", "L": "41-42"},
+        },
+    }
+
+    def __init__(self, products: Optional[List[Product]] = None):
+        source = None
+        if products is None:
+            products, source = self._load_fashion_catalog()
+        # Every published snapshot gets a fresh, never reused version number
+        self._versions = itertools.count(1)
+        self.catalog = CatalogSnapshot(
+            products, version=next(self._versions), source=source
+        )
+        self._reload_lock = asyncio.Lock()
         self.carts: Dict[str, Cart] = {}
         self.current_page = "home"
         self.session_id = str(uuid.uuid4())
         self.user_preferences = {}
 
+    @property
+    def products(self) -> Tuple[Product, ...]:
+        return self.catalog.products
+
+    @property
+    def catalog_version(self) -> int:
+        return self.catalog.version
+
+    @property
+    def catalog_revision(self) -> str:
+        return self.catalog.revision
+
+    @property
+    def search_cache(self) -> QueryResultCache:
+        return self.catalog.search_cache
+
     def _resolve_session(self, session_id: Optional[str]) -> str:
         sid = (session_id or "").strip()
         if not sid:
@@ -518,1442 +947,40 @@ class DataStore:
             self.carts[sid] = cart
         return cart
 
-    def _load_fashion_catalog(self) -> List[Product]:
-        """Load comprehensive Italian fashion catalog"""
-        products_data = [
-            # T-SHIRTS & POLO
-            {
-                "id": "550e8400-0001-41d4-a716-446655440001",
-                "name": "T-Shirt Basic Cotone Bio",
-                "brand": "EcoWear",
-                "description": "T-shirt basic in cotone biologico, perfetta per ogni occasione",
-                "description_long": "T-shirt realizzata in 100% cotone biologico certificato GOTS. Taglio regular fit, girocollo classico. Morbida al tatto e traspirante, ideale per la primavera/estate. Lavabile in lavatrice a 30°.",
-                "category": ProductCategory.TSHIRT,
-                "subcategory": "basic",
-                "gender": Gender.UNISEX,
-                "price": 19.90,
-                "original_price": 29.90,
-                "discount_percentage": 33,
-                "on_sale": True,
-                "materials": ["100% Cotone biologico"],
-                "care_instructions": "Lavare a 30°, non candeggiare, stirare a bassa temperatura",
-                "season": "Primavera/Estate",
-                "style": "Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Bianco",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Bianco",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Bianco",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Grigio melange",
-                        color_code="#B0B0B0",
-                        available=True),
-                ],
-                "images": ["/images/tshirt-basic-1.jpg", "/images/tshirt-basic-2.jpg"],
-                "features": ["Traspirante", "Cotone biologico", "Taglio regular"],
-                "rating": 4.6,
-                "reviews": 234,
-                "tags": [
-                    "basic",
-                    "essentials",
-                    "cotone",
-                    "bio",
-                    "unisex",
-                    "maglia",
-                    "maglietta",
-                ],
-            },
-            {
-                "id": "550e8400-0002-41d4-a716-446655440002",
-                "name": "Polo Elegante Piquet",
-                "brand": "Milano Style",
-                "description": "Polo in piquet di cotone, elegante e versatile",
-                "description_long": "Polo realizzata in piquet di cotone premium. Colletto classico con tre bottoni, taglio slim fit. Perfetta per look smart casual. Dettagli curati e logo ricamato sul petto.",
-                "category": ProductCategory.TSHIRT,
-                "subcategory": "polo",
-                "gender": Gender.UOMO,
-                "price": 49.90,
-                "original_price": 69.90,
-                "discount_percentage": 29,
-                "on_sale": True,
-                "materials": ["100% Cotone piquet"],
-                "care_instructions": "Lavare a 40°, stirare a media temperatura",
-                "season": "Quattro stagioni",
-                "style": "Smart Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Bordeaux",
-                        color_code="#800020",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Bordeaux",
-                        color_code="#800020",
-                        available=True),
-                ],
-                "images": ["/images/polo-1.jpg"],
-                "features": ["Slim fit", "Logo ricamato", "Colletto button-down"],
-                "rating": 4.7,
-                "reviews": 89,
-                "tags": ["polo", "elegante", "piquet", "smart", "business casual"],
-            },
-            # CAMICIE
-            {
-                "id": "550e8400-0003-41d4-a716-446655440003",
-                "name": "Camicia Oxford Classica",
-                "brand": "Sartoria Italiana",
-                "description": "Camicia Oxford button-down, un classico intramontabile",
-                "description_long": "Camicia in tessuto Oxford 100% cotone. Colletto button-down, taglio regular fit. Taschino sul petto sinistro. Perfetta per l'ufficio o occasioni formali.",
-                "category": ProductCategory.CAMICIA,
-                "subcategory": "formale",
-                "gender": Gender.UOMO,
-                "price": 79.90,
-                "original_price": 99.90,
-                "discount_percentage": 20,
-                "on_sale": True,
-                "materials": ["100% Cotone Oxford"],
-                "care_instructions": "Lavare a 40°, stirare ad alta temperatura",
-                "season": "Quattro stagioni",
-                "style": "Formale/Business",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Bianco",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Bianco",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Bianco",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Azzurro",
-                        color_code="#87CEEB",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Azzurro",
-                        color_code="#87CEEB",
-                        available=True),
-                ],
-                "images": ["/images/camicia-oxford.jpg"],
-                "features": ["Button-down", "Taschino", "No stiro"],
-                "rating": 4.8,
-                "reviews": 156,
-                "tags": ["camicia", "oxford", "formale", "ufficio", "business"],
-            },
-            {
-                "id": "550e8400-0004-41d4-a716-446655440004",
-                "name": "Camicetta Seta Stampata",
-                "brand": "Donna Elegante",
-                "description": "Camicetta in seta con stampa floreale",
-                "description_long": "Elegante camicetta in 100% seta con delicata stampa floreale. Colletto a V, maniche lunghe con polsini. Vestibilità morbida e femminile.",
-                "category": ProductCategory.CAMICIA,
-                "subcategory": "elegante",
-                "gender": Gender.DONNA,
-                "price": 89.90,
-                "original_price": 129.90,
-                "discount_percentage": 31,
-                "on_sale": True,
-                "materials": ["100% Seta"],
-                "care_instructions": "Lavaggio a secco consigliato",
-                "season": "Primavera/Estate",
-                "style": "Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Rosa antico",
-                        color_code="#D4A5A5",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Rosa antico",
-                        color_code="#D4A5A5",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Rosa antico",
-                        color_code="#D4A5A5",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Blu polvere",
-                        color_code="#B0C4DE",
-                        available=True),
-                ],
-                "images": ["/images/camicetta-seta.jpg"],
-                "features": ["100% Seta", "Stampa floreale", "Taglio femminile"],
-                "rating": 4.9,
-                "reviews": 67,
-                "tags": ["camicetta", "blusa", "seta", "elegante", "floreale"],
-            },
-            # MAGLIONI
-            {
-                "id": "550e8400-0005-41d4-a716-446655440005",
-                "name": "Maglione Cashmere Girocollo",
-                "brand": "Luxury Knit",
-                "description": "Maglione girocollo in puro cashmere",
-                "description_long": "Lussuoso maglione in 100% cashmere mongoliano. Girocollo classico, vestibilità regular. Morbidissimo e caldissimo, perfetto per l'inverno.",
-                "category": ProductCategory.MAGLIONE,
-                "subcategory": "pullover",
-                "gender": Gender.UNISEX,
-                "price": 179.90,
-                "original_price": 249.90,
-                "discount_percentage": 28,
-                "on_sale": True,
-                "materials": ["100% Cashmere"],
-                "care_instructions": "Lavaggio a mano, asciugare in piano",
-                "season": "Autunno/Inverno",
-                "style": "Elegante Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Cammello",
-                        color_code="#C19A6B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Cammello",
-                        color_code="#C19A6B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Cammello",
-                        color_code="#C19A6B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Grigio antracite",
-                        color_code="#293133",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Grigio antracite",
-                        color_code="#293133",
-                        available=True),
-                ],
-                "images": ["/images/maglione-cashmere.jpg"],
-                "features": ["Puro cashmere", "Extra morbido", "Termoregolatore"],
-                "rating": 4.9,
-                "reviews": 43,
-                "tags": ["maglione", "cashmere", "pullover", "lusso", "inverno"],
-            },
-            {
-                "id": "550e8400-0006-41d4-a716-446655440006",
-                "name": "Dolcevita Lana Merino",
-                "brand": "Nordic Style",
-                "description": "Dolcevita in lana merino fine",
-                "description_long": "Dolcevita realizzato in finissima lana merino. Ottimo isolamento termico, naturalmente antibatterico. Perfetto sotto giacche e blazer.",
-                "category": ProductCategory.MAGLIONE,
-                "subcategory": "dolcevita",
-                "gender": Gender.DONNA,
-                "price": 69.90,
-                "original_price": 89.90,
-                "discount_percentage": 22,
-                "on_sale": True,
-                "materials": ["100% Lana merino"],
-                "care_instructions": "Lavare a 30° programma lana",
-                "season": "Autunno/Inverno",
-                "style": "Casual Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Panna",
-                        color_code="#FFFDD0",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Panna",
-                        color_code="#FFFDD0",
-                        available=True),
-                ],
-                "images": ["/images/dolcevita-lana.jpg"],
-                "features": ["Lana merino", "Antibatterico naturale", "Slim fit"],
-                "rating": 4.7,
-                "reviews": 91,
-                "tags": ["dolcevita", "lana", "merino", "collo alto", "inverno"],
-            },
-            # FELPE
-            {
-                "id": "550e8400-0007-41d4-a716-446655440007",
-                "name": "Felpa con Cappuccio Oversize",
-                "brand": "Street Urban",
-                "description": "Felpa hoodie oversize in cotone pesante",
-                "description_long": "Felpa con cappuccio dal taglio oversize. Cotone pesante 400gsm, interno felpato. Tasche a marsupio, coulisse al cappuccio. Perfetta per look streetwear.",
-                "category": ProductCategory.FELPA,
-                "subcategory": "hoodie",
-                "gender": Gender.UNISEX,
-                "price": 59.90,
-                "original_price": 79.90,
-                "discount_percentage": 25,
-                "on_sale": True,
-                "materials": ["80% Cotone", "20% Poliestere"],
-                "care_instructions": "Lavare a rovescio a 30°",
-                "season": "Autunno/Inverno",
-                "style": "Streetwear",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Grigio melange",
-                        color_code="#B0B0B0",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Grigio melange",
-                        color_code="#B0B0B0",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Verde oliva",
-                        color_code="#708238",
-                        available=True),
-                ],
-                "images": ["/images/felpa-hoodie.jpg"],
-                "features": ["Oversize", "Cappuccio regolabile", "Tasche marsupio"],
-                "rating": 4.8,
-                "reviews": 312,
-                "tags": ["felpa", "hoodie", "cappuccio", "streetwear", "oversize"],
-            },
-            {
-                "id": "550e8400-0008-41d4-a716-446655440008",
-                "name": "Felpa Girocollo Vintage",
-                "brand": "Retro Sport",
-                "description": "Felpa girocollo stile vintage con logo",
-                "description_long": "Felpa girocollo ispirata agli anni '90. Cotone biologico, vestibilità regular. Logo ricamato sul petto. Polsini e orlo a costine.",
-                "category": ProductCategory.FELPA,
-                "subcategory": "girocollo",
-                "gender": Gender.UOMO,
-                "price": 49.90,
-                "original_price": 69.90,
-                "discount_percentage": 29,
-                "on_sale": True,
-                "materials": ["100% Cotone biologico"],
-                "care_instructions": "Lavare a 30°",
-                "season": "Primavera/Autunno",
-                "style": "Vintage",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Grigio chiaro",
-                        color_code="#D3D3D3",
-                        available=True),
-                ],
-                "images": ["/images/felpa-vintage.jpg"],
-                "features": ["Cotone biologico", "Logo ricamato", "Stile vintage"],
-                "rating": 4.6,
-                "reviews": 178,
-                "tags": ["felpa", "girocollo", "vintage", "retro", "cotone bio"],
-            },
-            # GIACCHE
-            {
-                "id": "550e8400-0009-41d4-a716-446655440009",
-                "name": "Bomber in Pelle",
-                "brand": "Aviator Style",
-                "description": "Bomber in vera pelle con fodera termica",
-                "description_long": "Bomber realizzato in pelle di agnello premium. Fodera termica removibile, chiusura zip YKK. Tasche laterali e interna. Polsini e orlo elasticizzati.",
-                "category": ProductCategory.GIACCA,
-                "subcategory": "bomber",
-                "gender": Gender.UOMO,
-                "price": 299.90,
-                "original_price": 449.90,
-                "discount_percentage": 33,
-                "on_sale": True,
-                "materials": ["Pelle di agnello", "Fodera: 100% Poliestere"],
-                "care_instructions": "Pulizia specializzata per pelle",
-                "season": "Autunno/Inverno",
-                "style": "Urban",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Marrone",
-                        color_code="#8B4513",
-                        available=True),
-                ],
-                "images": ["/images/bomber-pelle.jpg"],
-                "features": ["Vera pelle", "Fodera termica", "Water resistant"],
-                "rating": 4.9,
-                "reviews": 67,
-                "tags": ["bomber", "pelle", "giacca", "giubbotto", "aviator"],
-            },
-            {
-                "id": "550e8400-0010-41d4-a716-446655440010",
-                "name": "Piumino Lungo Donna",
-                "brand": "Arctic Warm",
-                "description": "Piumino lungo con cappuccio in pelliccia ecologica",
-                "description_long": "Piumino lungo fino al ginocchio. Imbottitura 90% piumino d'oca, 10% piume. Cappuccio con pelliccia ecologica removibile. Cintura in vita.",
-                "category": ProductCategory.GIACCA,
-                "subcategory": "piumino",
-                "gender": Gender.DONNA,
-                "price": 199.90,
-                "original_price": 349.90,
-                "discount_percentage": 43,
-                "on_sale": True,
-                "materials": ["Esterno: Poliestere", "Imbottitura: 90% piumino d'oca"],
-                "care_instructions": "Lavaggio professionale",
-                "season": "Inverno",
-                "style": "Casual Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Beige",
-                        color_code="#F5F5DC",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Beige",
-                        color_code="#F5F5DC",
-                        available=True),
-                ],
-                "images": ["/images/piumino-lungo.jpg"],
-                "features": ["Extra caldo", "Cappuccio removibile", "Antivento"],
-                "rating": 4.8,
-                "reviews": 234,
-                "tags": ["piumino", "cappotto", "inverno", "caldo", "lungo"],
-            },
-            {
-                "id": "550e8400-0011-41d4-a716-446655440011",
-                "name": "Blazer Sartoriale",
-                "brand": "Milano Tailoring",
-                "description": "Blazer sartoriale in lana vergine",
-                "description_long": "Blazer taglio sartoriale in pura lana vergine. Due bottoni, tasche con pattina. Fodera interna in viscosa. Perfetto per occasioni formali.",
-                "category": ProductCategory.GIACCA,
-                "subcategory": "blazer",
-                "gender": Gender.UOMO,
-                "price": 249.90,
-                "original_price": 399.90,
-                "discount_percentage": 38,
-                "on_sale": True,
-                "materials": ["100% Lana vergine", "Fodera: Viscosa"],
-                "care_instructions": "Lavaggio a secco",
-                "season": "Quattro stagioni",
-                "style": "Formale/Business",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Blu notte",
-                        color_code="#191970",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Blu notte",
-                        color_code="#191970",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Blu notte",
-                        color_code="#191970",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Grigio scuro",
-                        color_code="#696969",
-                        available=True),
-                ],
-                "images": ["/images/blazer-lana.jpg"],
-                "features": ["Taglio sartoriale", "Lana vergine", "Fodera completa"],
-                "rating": 4.9,
-                "reviews": 89,
-                "tags": ["blazer", "giacca", "formale", "sartoriale", "business"],
-            },
-            # PANTALONI
-            {
-                "id": "550e8400-0012-41d4-a716-446655440012",
-                "name": "Jeans Slim Fit Stretch",
-                "brand": "Denim Co",
-                "description": "Jeans slim fit in denim stretch",
-                "description_long": "Jeans dal taglio slim in denim elasticizzato. Vita media, gamba affusolata. Lavaggio stone washed. Cinque tasche classiche.",
-                "category": ProductCategory.PANTALONI,
-                "subcategory": "jeans",
-                "gender": Gender.UOMO,
-                "price": 79.90,
-                "original_price": 99.90,
-                "discount_percentage": 20,
-                "on_sale": True,
-                "materials": ["98% Cotone", "2% Elastan"],
-                "care_instructions": "Lavare a rovescio a 30°",
-                "season": "Quattro stagioni",
-                "style": "Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Blu scuro",
-                        color_code="#00008B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Blu scuro",
-                        color_code="#00008B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Blu scuro",
-                        color_code="#00008B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Blu scuro",
-                        color_code="#00008B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                ],
-                "images": ["/images/jeans-slim.jpg"],
-                "features": ["Stretch", "Slim fit", "Stone washed"],
-                "rating": 4.7,
-                "reviews": 456,
-                "tags": ["jeans", "denim", "pantaloni", "slim", "stretch"],
-            },
-            {
-                "id": "550e8400-0013-41d4-a716-446655440013",
-                "name": "Chino Eleganti",
-                "brand": "Classic Style",
-                "description": "Pantaloni chino in cotone",
-                "description_long": "Pantaloni chino in cotone twill. Taglio regular, vita media. Perfetti per look business casual. Tasche laterali e posteriori.",
-                "category": ProductCategory.PANTALONI,
-                "subcategory": "chino",
-                "gender": Gender.UOMO,
-                "price": 69.90,
-                "original_price": 89.90,
-                "discount_percentage": 22,
-                "on_sale": True,
-                "materials": ["100% Cotone twill"],
-                "care_instructions": "Lavare a 40°, stirare a media temperatura",
-                "season": "Quattro stagioni",
-                "style": "Business Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Beige",
-                        color_code="#F5F5DC",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Beige",
-                        color_code="#F5F5DC",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Beige",
-                        color_code="#F5F5DC",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                ],
-                "images": ["/images/chino.jpg"],
-                "features": ["Regular fit", "Cotone twill", "No stiro"],
-                "rating": 4.6,
-                "reviews": 189,
-                "tags": ["chino", "pantaloni", "eleganti", "cotone", "business"],
-            },
-            {
-                "id": "550e8400-0014-41d4-a716-446655440014",
-                "name": "Pantaloni Palazzo Donna",
-                "brand": "Fashion Forward",
-                "description": "Pantaloni palazzo a vita alta",
-                "description_long": "Eleganti pantaloni palazzo a vita alta. Gamba ampia e fluida, cintura in vita. Tessuto leggero e traspirante. Chiusura zip laterale.",
-                "category": ProductCategory.PANTALONI,
-                "subcategory": "palazzo",
-                "gender": Gender.DONNA,
-                "price": 89.90,
-                "original_price": 119.90,
-                "discount_percentage": 25,
-                "on_sale": True,
-                "materials": ["65% Viscosa", "35% Poliestere"],
-                "care_instructions": "Lavare a 30°, appendere ad asciugare",
-                "season": "Primavera/Estate",
-                "style": "Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Crema",
-                        color_code="#FFFDD0",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Crema",
-                        color_code="#FFFDD0",
-                        available=True),
-                ],
-                "images": ["/images/pantaloni-palazzo.jpg"],
-                "features": ["Vita alta", "Gamba ampia", "Fluidi"],
-                "rating": 4.7,
-                "reviews": 123,
-                "tags": ["palazzo", "pantaloni", "eleganti", "vita alta", "donna"],
-            },
-            # SHORTS
-            {
-                "id": "550e8400-0015-41d4-a716-446655440015",
-                "name": "Bermuda Cargo",
-                "brand": "Adventure Gear",
-                "description": "Bermuda cargo con tasche multiple",
-                "description_long": "Bermuda in cotone resistente con tasche cargo laterali. Vita regolabile con coulisse. Perfetti per attività outdoor e tempo libero.",
-                "category": ProductCategory.SHORTS,
-                "subcategory": "cargo",
-                "gender": Gender.UOMO,
-                "price": 39.90,
-                "original_price": 59.90,
-                "discount_percentage": 33,
-                "on_sale": True,
-                "materials": ["100% Cotone canvas"],
-                "care_instructions": "Lavare a 40°",
-                "season": "Primavera/Estate",
-                "style": "Casual/Outdoor",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Kaki",
-                        color_code="#C3B091",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Kaki",
-                        color_code="#C3B091",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Kaki",
-                        color_code="#C3B091",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Verde militare",
-                        color_code="#4B5320",
-                        available=True),
-                ],
-                "images": ["/images/bermuda-cargo.jpg"],
-                "features": ["Tasche cargo", "Resistente", "Coulisse in vita"],
-                "rating": 4.5,
-                "reviews": 234,
-                "tags": ["bermuda", "shorts", "cargo", "estate", "pantaloncini"],
-            },
-            {
-                "id": "550e8400-0016-41d4-a716-446655440016",
-                "name": "Shorts Sportivi Donna",
-                "brand": "Active Wear",
-                "description": "Shorts sportivi elasticizzati",
-                "description_long": "Shorts sportivi in tessuto tecnico elasticizzato. Vita alta con elastico comfort. Perfetti per yoga, running e palestra.",
-                "category": ProductCategory.SHORTS,
-                "subcategory": "sport",
-                "gender": Gender.DONNA,
-                "price": 29.90,
-                "original_price": 39.90,
-                "discount_percentage": 25,
-                "on_sale": True,
-                "materials": ["87% Poliestere", "13% Elastan"],
-                "care_instructions": "Lavare a 30°, asciugatura rapida",
-                "season": "Primavera/Estate",
-                "style": "Sport",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Rosa",
-                        color_code="#FFC0CB",
-                        available=True),
-                ],
-                "images": ["/images/shorts-sport.jpg"],
-                "features": ["Elasticizzati", "Traspiranti", "Quick dry"],
-                "rating": 4.6,
-                "reviews": 178,
-                "tags": ["shorts", "sport", "fitness", "yoga", "pantaloncini"],
-            },
-            # GONNE
-            {
-                "id": "550e8400-0017-41d4-a716-446655440017",
-                "name": "Gonna Midi Plissettata",
-                "brand": "Eleganza",
-                "description": "Gonna midi plissettata in chiffon",
-                "description_long": "Elegante gonna midi con plissettatura fine. Tessuto chiffon leggero e fluido. Fodera interna. Chiusura zip laterale invisibile.",
-                "category": ProductCategory.GONNA,
-                "subcategory": "midi",
-                "gender": Gender.DONNA,
-                "price": 79.90,
-                "original_price": 109.90,
-                "discount_percentage": 27,
-                "on_sale": True,
-                "materials": ["Esterno: 100% Poliestere chiffon", "Fodera: Viscosa"],
-                "care_instructions": "Lavaggio delicato a 30°",
-                "season": "Primavera/Estate",
-                "style": "Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Rosa cipria",
-                        color_code="#F4C2C2",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Rosa cipria",
-                        color_code="#F4C2C2",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Rosa cipria",
-                        color_code="#F4C2C2",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Blu navy",
-                        color_code="#000080",
-                        available=True),
-                ],
-                "images": ["/images/gonna-midi.jpg"],
-                "features": ["Plissettata", "Lunghezza midi", "Fodera"],
-                "rating": 4.8,
-                "reviews": 91,
-                "tags": ["gonna", "midi", "plissettata", "elegante", "chiffon"],
-            },
-            {
-                "id": "550e8400-0018-41d4-a716-446655440018",
-                "name": "Minigonna Denim",
-                "brand": "Young Fashion",
-                "description": "Minigonna in denim con bottoni frontali",
-                "description_long": "Minigonna in denim rigido con chiusura a bottoni frontale. Taglio A-line, tasche frontali e posteriori. Look vintage anni '70.",
-                "category": ProductCategory.GONNA,
-                "subcategory": "mini",
-                "gender": Gender.DONNA,
-                "price": 39.90,
-                "original_price": 59.90,
-                "discount_percentage": 33,
-                "on_sale": True,
-                "materials": ["100% Cotone denim"],
-                "care_instructions": "Lavare a rovescio a 30°",
-                "season": "Primavera/Estate",
-                "style": "Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Denim chiaro",
-                        color_code="#6495ED",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Denim chiaro",
-                        color_code="#6495ED",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Denim chiaro",
-                        color_code="#6495ED",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Denim scuro",
-                        color_code="#00008B",
-                        available=True),
-                ],
-                "images": ["/images/minigonna-denim.jpg"],
-                "features": ["Bottoni frontali", "Taglio A-line", "Vintage style"],
-                "rating": 4.5,
-                "reviews": 156,
-                "tags": ["gonna", "mini", "denim", "jeans", "casual"],
-            },
-            # VESTITI
-            {
-                "id": "550e8400-0019-41d4-a716-446655440019",
-                "name": "Abito Lungo da Sera",
-                "brand": "Haute Couture",
-                "description": "Abito lungo in seta con schiena scoperta",
-                "description_long": "Elegantissimo abito lungo in pura seta. Schiena scoperta con laccetti incrociati. Spacco laterale. Perfetto per eventi formali e serate di gala.",
-                "category": ProductCategory.VESTITO,
-                "subcategory": "sera",
-                "gender": Gender.DONNA,
-                "price": 199.90,
-                "original_price": 349.90,
-                "discount_percentage": 43,
-                "on_sale": True,
-                "materials": ["100% Seta"],
-                "care_instructions": "Lavaggio a secco professionale",
-                "season": "Quattro stagioni",
-                "style": "Formale/Gala",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Rosso borgogna",
-                        color_code="#800020",
-                        available=True),
-                ],
-                "images": ["/images/abito-sera.jpg"],
-                "features": ["100% Seta", "Schiena scoperta", "Spacco laterale"],
-                "rating": 4.9,
-                "reviews": 45,
-                "tags": ["abito", "vestito", "sera", "elegante", "gala", "lungo"],
-            },
-            {
-                "id": "550e8400-0020-41d4-a716-446655440020",
-                "name": "Vestito Chemisier",
-                "brand": "Daily Chic",
-                "description": "Vestito chemisier con cintura",
-                "description_long": "Vestito chemisier midi con bottoni frontali. Cintura in vita coordinata. Maniche lunghe con polsini. Versatile per ufficio e tempo libero.",
-                "category": ProductCategory.VESTITO,
-                "subcategory": "casual",
-                "gender": Gender.DONNA,
-                "price": 89.90,
-                "original_price": 119.90,
-                "discount_percentage": 25,
-                "on_sale": True,
-                "materials": ["70% Viscosa", "30% Poliestere"],
-                "care_instructions": "Lavare a 30°, stirare a bassa temperatura",
-                "season": "Primavera/Autunno",
-                "style": "Business Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Verde salvia",
-                        color_code="#87A96B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Verde salvia",
-                        color_code="#87A96B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Verde salvia",
-                        color_code="#87A96B",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Blu polvere",
-                        color_code="#B0C4DE",
-                        available=True),
-                ],
-                "images": ["/images/vestito-chemisier.jpg"],
-                "features": ["Cintura inclusa", "Bottoni frontali", "Versatile"],
-                "rating": 4.7,
-                "reviews": 134,
-                "tags": ["vestito", "chemisier", "midi", "ufficio", "casual"],
-            },
-            # SCARPE
-            {
-                "id": "550e8400-0021-41d4-a716-446655440021",
-                "name": "Sneakers Vintage Pelle",
-                "brand": "Retro Kicks",
-                "description": "Sneakers in pelle stile vintage",
-                "description_long": "Sneakers ispirate ai modelli anni '80. Tomaia in pelle premium, suola in gomma vulcanizzata. Dettagli a contrasto. Comfort per tutto il giorno.",
-                "category": ProductCategory.SCARPE,
-                "subcategory": "sneakers",
-                "gender": Gender.UNISEX,
-                "price": 99.90,
-                "original_price": 139.90,
-                "discount_percentage": 29,
-                "on_sale": True,
-                "materials": ["Tomaia: Pelle", "Suola: Gomma"],
-                "care_instructions": "Pulire con panno umido, impermeabilizzare",
-                "season": "Quattro stagioni",
-                "style": "Casual/Street",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Bianco/Verde",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Bianco/Verde",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Bianco/Verde",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Bianco/Verde",
-                        color_code="#FFFFFF",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero/Bianco",
-                        color_code="#000000",
-                        available=True),
-                ],
-                "images": ["/images/sneakers-vintage.jpg"],
-                "features": ["Pelle premium", "Stile vintage", "Suola vulcanizzata"],
-                "rating": 4.8,
-                "reviews": 289,
-                "tags": ["scarpe", "sneakers", "vintage", "pelle", "ginnastica"],
-            },
-            {
-                "id": "550e8400-0022-41d4-a716-446655440022",
-                "name": "Stivali Chelsea Pelle",
-                "brand": "London Boot Co",
-                "description": "Stivali Chelsea in pelle con elastici",
-                "description_long": "Classici stivali Chelsea in pelle di vitello. Elastici laterali, linguetta posteriore. Suola in cuoio con tacco 3cm. Eleganti e versatili.",
-                "category": ProductCategory.SCARPE,
-                "subcategory": "stivali",
-                "gender": Gender.DONNA,
-                "price": 149.90,
-                "original_price": 199.90,
-                "discount_percentage": 25,
-                "on_sale": True,
-                "materials": ["Pelle di vitello", "Suola in cuoio"],
-                "care_instructions": "Trattare con crema per pelle",
-                "season": "Autunno/Inverno",
-                "style": "Elegante Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Marrone",
-                        color_code="#8B4513",
-                        available=True),
-                ],
-                "images": ["/images/stivali-chelsea.jpg"],
-                "features": ["Pelle di vitello", "Elastici laterali", "Suola in cuoio"],
-                "rating": 4.9,
-                "reviews": 156,
-                "tags": ["stivali", "chelsea", "pelle", "eleganti", "inverno"],
-            },
-            {
-                "id": "550e8400-0023-41d4-a716-446655440023",
-                "name": "Sandali Platform",
-                "brand": "Summer Vibes",
-                "description": "Sandali con platform e cinturino alla caviglia",
-                "description_long": "Sandali con platform 5cm e cinturino regolabile alla caviglia. Tomaia in eco-pelle, suola in gomma antiscivolo. Perfetti per l'estate.",
-                "category": ProductCategory.SCARPE,
-                "subcategory": "sandali",
-                "gender": Gender.DONNA,
-                "price": 59.90,
-                "original_price": 79.90,
-                "discount_percentage": 25,
-                "on_sale": True,
-                "materials": ["Eco-pelle", "Suola: Gomma"],
-                "care_instructions": "Pulire con panno umido",
-                "season": "Primavera/Estate",
-                "style": "Casual",
-                "variants": [
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nude",
-                        color_code="#F5DEB3",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nude",
-                        color_code="#F5DEB3",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nude",
-                        color_code="#F5DEB3",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                ],
-                "images": ["/images/sandali-platform.jpg"],
-                "features": ["Platform 5cm", "Cinturino regolabile", "Antiscivolo"],
-                "rating": 4.5,
-                "reviews": 201,
-                "tags": ["sandali", "platform", "estate", "ciabatte", "scarpe"],
-            },
-            # ACCESSORI
-            {
-                "id": "550e8400-0024-41d4-a716-446655440024",
-                "name": "Cintura in Pelle Reversibile",
-                "brand": "Leather Craft",
-                "description": "Cintura reversibile nero/marrone",
-                "description_long": "Cintura in vera pelle con fibbia girevole. Reversibile nero/marrone per massima versatilità. Larghezza 3.5cm, tagliabile per adattare la misura.",
-                "category": ProductCategory.ACCESSORI,
-                "subcategory": "cinture",
-                "gender": Gender.UOMO,
-                "price": 49.90,
-                "original_price": 69.90,
-                "discount_percentage": 29,
-                "on_sale": True,
-                "materials": ["100% Pelle bovina"],
-                "care_instructions": "Trattare con crema per pelle",
-                "season": "Quattro stagioni",
-                "style": "Classico",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero/Marrone",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Nero/Marrone",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.XL,
-                        color="Nero/Marrone",
-                        color_code="#000000",
-                        available=True),
-                ],
-                "images": ["/images/cintura-reversibile.jpg"],
-                "features": ["Reversibile", "Vera pelle", "Fibbia girevole"],
-                "rating": 4.7,
-                "reviews": 167,
-                "tags": ["cintura", "pelle", "accessori", "reversibile"],
-            },
-            {
-                "id": "550e8400-0025-41d4-a716-446655440025",
-                "name": "Borsa a Tracolla Grande",
-                "brand": "Urban Bags",
-                "description": "Borsa a tracolla capiente in pelle vegana",
-                "description_long": "Borsa a tracolla in pelle vegana di alta qualità. Scomparto principale con zip, tasche interne ed esterne. Tracolla regolabile e removibile.",
-                "category": ProductCategory.ACCESSORI,
-                "subcategory": "borse",
-                "gender": Gender.DONNA,
-                "price": 89.90,
-                "original_price": 129.90,
-                "discount_percentage": 31,
-                "on_sale": True,
-                "materials": ["Pelle vegana (PU)"],
-                "care_instructions": "Pulire con panno umido",
-                "season": "Quattro stagioni",
-                "style": "Urban",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Cognac",
-                        color_code="#8B4513",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Grigio",
-                        color_code="#808080",
-                        available=True),
-                ],
-                "images": ["/images/borsa-tracolla.jpg"],
-                "features": ["Capiente", "Multi-tasca", "Tracolla regolabile"],
-                "rating": 4.8,
-                "reviews": 234,
-                "tags": ["borsa", "tracolla", "accessori", "vegana"],
-            },
-            {
-                "id": "550e8400-0026-41d4-a716-446655440026",
-                "name": "Cappello Panama",
-                "brand": "Summer Hat Co",
-                "description": "Cappello Panama in paglia naturale",
-                "description_long": "Autentico cappello Panama tessuto a mano in Ecuador. Paglia toquilla naturale, fascia nera in gros-grain. Protezione UV naturale.",
-                "category": ProductCategory.ACCESSORI,
-                "subcategory": "cappelli",
-                "gender": Gender.UNISEX,
-                "price": 79.90,
-                "original_price": 119.90,
-                "discount_percentage": 33,
-                "on_sale": True,
-                "materials": ["Paglia toquilla naturale"],
-                "care_instructions": "Conservare in luogo asciutto",
-                "season": "Primavera/Estate",
-                "style": "Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Naturale",
-                        color_code="#F5DEB3",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Naturale",
-                        color_code="#F5DEB3",
-                        available=True),
-                ],
-                "images": ["/images/cappello-panama.jpg"],
-                "features": ["Tessuto a mano", "Protezione UV", "Paglia naturale"],
-                "rating": 4.9,
-                "reviews": 78,
-                "tags": ["cappello", "panama", "estate", "paglia", "accessori"],
-            },
-            {
-                "id": "550e8400-0027-41d4-a716-446655440027",
-                "name": "Sciarpa Cashmere",
-                "brand": "Luxury Accessories",
-                "description": "Sciarpa in puro cashmere",
-                "description_long": "Lussuosa sciarpa in 100% cashmere. Dimensioni 200x70cm. Frangia alle estremità. Morbidissima e calda.",
-                "category": ProductCategory.ACCESSORI,
-                "subcategory": "sciarpe",
-                "gender": Gender.UNISEX,
-                "price": 99.90,
-                "original_price": 149.90,
-                "discount_percentage": 33,
-                "on_sale": True,
-                "materials": ["100% Cashmere"],
-                "care_instructions": "Lavaggio a mano o a secco",
-                "season": "Autunno/Inverno",
-                "style": "Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Grigio perla",
-                        color_code="#E5E4E2",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Navy",
-                        color_code="#000080",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Bordeaux",
-                        color_code="#800020",
-                        available=True),
-                ],
-                "images": ["/images/sciarpa-cashmere.jpg"],
-                "features": ["100% Cashmere", "200x70cm", "Extra morbida"],
-                "rating": 4.9,
-                "reviews": 56,
-                "tags": ["sciarpa", "cashmere", "inverno", "lusso", "accessori"],
-            },
-            {
-                "id": "550e8400-0028-41d4-a716-446655440028",
-                "name": "Zaino Business",
-                "brand": "Tech Gear",
-                "description": "Zaino per laptop con porta USB",
-                "description_long": 'Zaino professionale con scomparto imbottito per laptop fino a 15.6". Porta USB esterna per powerbank. Schienale ergonomico traspirante.',
-                "category": ProductCategory.ACCESSORI,
-                "subcategory": "zaini",
-                "gender": Gender.UNISEX,
-                "price": 69.90,
-                "original_price": 99.90,
-                "discount_percentage": 30,
-                "on_sale": True,
-                "materials": ["Poliestere resistente all'acqua"],
-                "care_instructions": "Pulire con panno umido",
-                "season": "Quattro stagioni",
-                "style": "Business/Tech",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Grigio antracite",
-                        color_code="#293133",
-                        available=True),
-                ],
-                "images": ["/images/zaino-business.jpg"],
-                "features": ["Porta USB", "Impermeabile", "Scomparto laptop"],
-                "rating": 4.7,
-                "reviews": 345,
-                "tags": ["zaino", "business", "laptop", "tech", "accessori"],
-            },
-            # OUTFIT COMPLETI E SPECIAL ITEMS
-            {
-                "id": "550e8400-0029-41d4-a716-446655440029",
-                "name": "Completo Lino Uomo",
-                "brand": "Summer Suit",
-                "description": "Completo giacca e pantalone in lino",
-                "description_long": "Elegante completo estivo in puro lino. Giacca destrutturata e pantaloni con piega. Perfetto per matrimoni estivi e occasioni eleganti.",
-                "category": ProductCategory.GIACCA,
-                "subcategory": "completo",
-                "gender": Gender.UOMO,
-                "price": 299.90,
-                "original_price": 499.90,
-                "discount_percentage": 40,
-                "on_sale": True,
-                "materials": ["100% Lino"],
-                "care_instructions": "Lavaggio a secco consigliato",
-                "season": "Primavera/Estate",
-                "style": "Elegante",
-                "variants": [
-                    ProductVariant(
-                        size=Size.M,
-                        color="Beige",
-                        color_code="#F5F5DC",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Beige",
-                        color_code="#F5F5DC",
-                        available=True),
-                    ProductVariant(
-                        size=Size.L,
-                        color="Azzurro polvere",
-                        color_code="#B0C4DE",
-                        available=True),
-                ],
-                "images": ["/images/completo-lino.jpg"],
-                "features": ["100% Lino", "Giacca e pantalone", "Traspirante"],
-                "rating": 4.8,
-                "reviews": 34,
-                "tags": ["completo", "lino", "elegante", "matrimonio", "estate"],
-            },
-            {
-                "id": "550e8400-0030-41d4-a716-446655440030",
-                "name": "Tuta Sportiva Donna",
-                "brand": "Fit & Fashion",
-                "description": "Completo sportivo felpa e leggings",
-                "description_long": "Set coordinato felpa crop con cappuccio e leggings a vita alta. Tessuto tecnico elasticizzato, perfetto per yoga, pilates e palestra.",
-                "category": ProductCategory.FELPA,
-                "subcategory": "tuta",
-                "gender": Gender.DONNA,
-                "price": 89.90,
-                "original_price": 129.90,
-                "discount_percentage": 31,
-                "on_sale": True,
-                "materials": ["75% Poliestere", "25% Elastan"],
-                "care_instructions": "Lavare a 30°, non stirare",
-                "season": "Quattro stagioni",
-                "style": "Sport/Athleisure",
-                "variants": [
-                    ProductVariant(
-                        size=Size.XS,
-                        color="Rosa antico",
-                        color_code="#D4A5A5",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Rosa antico",
-                        color_code="#D4A5A5",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Rosa antico",
-                        color_code="#D4A5A5",
-                        available=True),
-                    ProductVariant(
-                        size=Size.S,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                    ProductVariant(
-                        size=Size.M,
-                        color="Nero",
-                        color_code="#000000",
-                        available=True),
-                ],
-                "images": ["/images/tuta-sportiva.jpg"],
-                "features": ["Set coordinato", "Elasticizzato", "Moisture wicking"],
-                "rating": 4.7,
-                "reviews": 267,
-                "tags": ["tuta", "sport", "fitness", "yoga", "completo", "athleisure"],
-            },
+    def _load_fashion_catalog(self) -> Tuple[List[Product], str]:
+        """Load comprehensive Italian fashion catalog, with the fingerprint of
+        what was loaded (source, build inputs and assets base URL)"""
+        products, fingerprint = load_catalog(
+            CATALOG_PATH,
+            CATALOG_SNAPSHOT_PATH,
+            build=self.build_catalog_products,
+            salt=catalog_snapshot_salt())
+        assets_base = os.getenv("ASSETS_BASE_URL", ASSETS_BASE_URL) or ""
+        source = hashlib.sha256(f"{fingerprint}\0{assets_base}".encode("utf-8"))
+        return self.resolve_image_urls(products), source.hexdigest()[:16]
+
+    @staticmethod
+    def resolve_image_urls(products: List[Product]) -> List[Product]:
+        """Point stored image paths at ASSETS_BASE_URL (a shallow copy per
+        product, no re-validation)"""
+        return [
+            product.model_copy(
+                update={"images": [build_image_url(image) for image in product.images]}
+            )
+            for product in products
         ]
 
-        # Resolve image URLs dynamically based on ASSETS_BASE_URL
-        for p in products_data:
-            if "images" in p and isinstance(p["images"], list):
-                p["images"] = [build_image_url(img) for img in p["images"]]
+    @staticmethod
+    def build_catalog_products(source: Dict[str, Any]) -> List[Product]:
+        """Validate the raw catalog source into Product models.
+
+        Image paths are kept as stored; ``resolve_image_urls`` applies the
+        deployment's assets base URL after loading.
+        """
+        products_data: List[Dict[str, Any]] = source.get("products", [])
 
         # Limit on-sale products to a small curated subset (max 10)
-        sale_ids: Set[str] = {
-            "550e8400-0001-41d4-a716-446655440001",  # T-Shirt Basic Cotone Bio
-            "550e8400-0002-41d4-a716-446655440002",  # Polo Elegante Piquet
-            "550e8400-0003-41d4-a716-446655440003",  # Camicia Oxford Classica
-            "550e8400-0007-41d4-a716-446655440007",  # Felpa con Cappuccio Oversize
-            "550e8400-0009-41d4-a716-446655440009",  # Bomber in Pelle
-            "550e8400-0012-41d4-a716-446655440012",  # Jeans Slim Fit Stretch
-            "550e8400-0021-41d4-a716-446655440021",  # Sneakers Vintage Pelle
-            "550e8400-0024-41d4-a716-446655440024",  # Cintura in Pelle Reversibile
-        }
+        sale_ids: Set[str] = set(source.get("sale_ids", []))
 
         for p in products_data:
             pid = p.get("id")
@@ -1981,117 +1008,374 @@ class DataStore:
 
         return [Product(**p) for p in products_data]
 
+    def _build_catalog_snapshot(self) -> CatalogSnapshot:
+        """Load the catalog source and index it (blocking; runs off the loop)"""
+        products, source = self._load_fashion_catalog()
+        return CatalogSnapshot(products, version=next(self._versions), source=source)
+
+    async def reload_catalog(self) -> CatalogSnapshot:
+        """Rebuild the catalog from its source and swap it in atomically.
+
+        The snapshot is built in a worker thread so the event loop (and the
+        websocket sessions it serves) keeps running; requests in flight finish
+        on the snapshot they started with. Carts and sessions are untouched.
+        """
+        async with self._reload_lock:
+            loop = asyncio.get_running_loop()
+            snapshot = await loop.run_in_executor(None, self._build_catalog_snapshot)
+            self.catalog = snapshot
+        logger.info(
+            f"Catalog reloaded: {len(snapshot)} products, version {snapshot.version}"
+        )
+        return snapshot
+
+    def upsert_product(self, product: Product) -> None:
+        """Add or replace a product, publishing a new catalog snapshot"""
+        self.catalog = self.catalog.with_product(product, version=next(self._versions))
+
+    def set_variant_availability(
+        self, product_id: str, size: str, color: str, available: bool
+    ) -> bool:
+        """Update the stock flag of a variant; returns False if it does not exist"""
+        if self.get_variant(product_id, size, color) is None:
+            return False
+        self.update_stock([(product_id, size, color, available)])
+        return True
+
+    def update_stock(self, updates: Iterable[Tuple[str, str, str, bool]]) -> int:
+        """Apply ``(product_id, size, color, available)`` stock flags in bulk.
+
+        Publishes one new snapshot for the whole batch, touching only the
+        stock bitsets; returns the number of variants that changed.
+        """
+        catalog = self.catalog
+        changes: List[Tuple[int, str, str, bool]] = []
+        for product_id, size, color, available in updates:
+            position = catalog.positions_by_id.get(product_id)
+            if position is None or not catalog.columns.is_offered(position, size, color):
+                continue
+            if catalog.columns.is_available(position, size, color) != available:
+                changes.append((position, size, color, available))
+        if changes:
+            self.catalog = catalog.with_stock(changes, version=next(self._versions))
+        return len(changes)
+
+    @staticmethod
+    def _canonical_filters(filters: Optional[SearchFilters]) -> Dict[str, Any]:
+        """Normalized filter criteria, shared by the mask compiler and cache keys"""
+        if filters is None:
+            return {}
+        criteria = filters.model_dump(exclude_none=True)
+        if "category" in criteria:
+            criteria["category"] = normalize_italian_terms(criteria["category"].lower())
+        if "subcategory" in criteria:
+            # Not part of the historic filter set
+            criteria.pop("subcategory")
+        for key in ("color", "brand", "season", "style"):
+            if key in criteria:
+                criteria[key] = criteria[key].lower()
+        for key in ("gender", "size"):
+            if key in criteria:
+                criteria[key] = criteria[key].value
+        return criteria
+
+    @staticmethod
+    def _filter_mask(
+        catalog: CatalogSnapshot, criteria: Dict[str, Any]
+    ) -> Optional[np.ndarray]:
+        """Compile canonical filter criteria into a boolean mask"""
+        if not criteria:
+            return None
+        return catalog.columns.mask(**criteria)
+
     def search_products(
         self,
         query: Optional[str] = None,
         filters: Optional[SearchFilters] = None,
-        limit: int = 10) -> List[Product]:
+        limit: int = 10,
+        sort: Optional[ProductSort] = None) -> List[Product]:
         """Advanced product search with Italian term normalization"""
-        results = self.products
-
-        # Apply query search with Italian normalization
-        if query:
-            query_normalized = normalize_italian_terms(query.lower())
-            query_terms = query_normalized.split()
-
-            results = []
-            for product in self.products:
-                # Calculate relevance score
-                score = 0
-                product_text = f"{product.name} {product.brand} {product.description} {product.category} {product.subcategory} {' '.join(product.tags)}".lower()
-                product_text_normalized = normalize_italian_terms(product_text)
-
-                for term in query_terms:
-                    if term in product_text_normalized:
-                        score += 2
-                    elif any(term in tag for tag in product.tags):
-                        score += 1
-
-                if score > 0:
-                    results.append((score, product))
-
-            # Sort by relevance score
-            results.sort(key=lambda x: x[0], reverse=True)
-            results = [p for _, p in results]
-
-        # Apply filters
-        if filters:
-            if filters.category:
-                cat_normalized = normalize_italian_terms(filters.category.lower())
-                results = [
-                    p
-                    for p in results
-                    if cat_normalized in p.category.value.lower()
-                    or cat_normalized in p.subcategory.lower()
-                ]
-
-            if filters.gender:
-                results = [
-                    p
-                    for p in results
-                    if p.gender == filters.gender or p.gender == Gender.UNISEX
-                ]
-
-            if filters.size:
-                results = [
-                    p
-                    for p in results
-                    if any(v.size == filters.size and v.available for v in p.variants)
-                ]
-
-            if filters.color:
-                color_lower = filters.color.lower()
-                results = [
-                    p
-                    for p in results
-                    if any(color_lower in v.color.lower() for v in p.variants)
-                ]
-
-            if filters.price_min is not None:
-                results = [p for p in results if p.price >= filters.price_min]
-
-            if filters.price_max is not None:
-                results = [p for p in results if p.price <= filters.price_max]
-
-            if filters.on_sale is not None:
-                results = [p for p in results if p.on_sale == filters.on_sale]
+        catalog = self.catalog
+        query_normalized = normalize_italian_terms(query.lower()) if query else ""
+        criteria = self._canonical_filters(filters)
+        sort = self._canonical_sort(sort)
+        cache_key = (
+            catalog.version,
+            " ".join(query_normalized.split()),
+            tuple(sorted(criteria.items())),
+            sort,
+            limit,
+        )
+        positions = catalog.search_cache.get(cache_key)
+        if positions is None:
+            positions, _ = self._search_positions(
+                catalog, query_normalized, criteria, limit, sort
+            )
+            catalog.search_cache.set(cache_key, positions)
+        return [catalog.products[position] for position in positions]
 
-            if filters.brand:
-                results = [
-                    p for p in results if filters.brand.lower() in p.brand.lower()
-                ]
+    def search_page(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[SearchFilters] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort: Optional[ProductSort] = None) -> Tuple[List[Product], int, Optional[str]]:
+        """One page of search results with the total hit count and next cursor.
+
+        Only the first ``offset + SEARCH_PAGE_WINDOW * limit`` results are
+        ranked, and cached with the hit count per query and catalog version:
+        the next pages are slices of that window, and a cursor past it ranks
+        a wider one. Raises CursorError for foreign cursors and
+        StaleCursorError once the catalog has changed.
+        """
+        catalog = self.catalog
+        query_normalized = normalize_italian_terms(query.lower()) if query else ""
+        criteria = self._canonical_filters(filters)
+        sort = self._canonical_sort(sort)
+        query_key = (
+            " ".join(query_normalized.split()),
+            tuple(sorted(criteria.items())),
+            sort,
+        )
+        fingerprint = query_fingerprint(query_key)
+
+        offset = 0
+        if cursor:
+            page_cursor = PageCursor.decode(cursor)
+            page_cursor.check(catalog.revision, fingerprint)
+            offset = page_cursor.offset
+
+        end = offset + max(limit, 0)
+        cache_key = ("page", catalog.version, *query_key)
+        window = catalog.search_cache.get(cache_key)
+        if window is None or len(window[0]) < min(end, window[1]):
+            window = self._search_positions(
+                catalog,
+                query_normalized,
+                criteria,
+                offset + SEARCH_PAGE_WINDOW * max(limit, 1),
+                sort)
+            catalog.search_cache.set(cache_key, window)
+        positions, total = window
+
+        next_cursor = None
+        if end < total and end > offset:
+            next_cursor = PageCursor(catalog.revision, fingerprint, end).encode()
+        page = [catalog.products[position] for position in positions[offset:end]]
+        return page, total, next_cursor
+
+    def _search_positions(
+        self,
+        catalog: CatalogSnapshot,
+        query_normalized: str,
+        criteria: Dict[str, Any],
+        limit: Optional[int],
+        sort: Optional[str] = None) -> Tuple[np.ndarray, int]:
+        """The best ``limit`` matching positions (all for None) as an int32
+        array, and the number of matches; the rest is never ordered"""
+        limit = None if limit is None else max(limit, 0)
+        if sort in (ProductSort.PRICE_ASC.value, ProductSort.PRICE_DESC.value):
+            order = self._price_sorted_positions(catalog, query_normalized, criteria, sort)
+            return order[:limit].astype(np.int32), len(order)
+        if sort is not None:
+            order = self._view_positions(catalog, query_normalized, criteria, sort)
+            return order[:limit].astype(np.int32), len(order)
+        mask = self._filter_mask(catalog, criteria)
+
+        # Apply query search with Italian normalization, BM25-ranked top-k
+        if query_normalized.strip():
+            scores = catalog.search_index.score(query_normalized.split())
+            if not scores:
+                order = np.array(
+                    self._fuzzy_positions(catalog, query_normalized, None, mask),
+                    dtype=np.int32)
+                return order[:limit], len(order)
+            total = len(scores)
+            if mask is not None:
+                matches = np.fromiter(scores, dtype=np.int64, count=len(scores))
+                total = int(np.count_nonzero(mask[matches]))
+            positions = catalog.search_index.rank(scores, limit=limit, accept=mask)
+            return np.array(positions, dtype=np.int32), total
+        if mask is not None:
+            matches = np.flatnonzero(mask)
+            return matches[:limit].astype(np.int32), len(matches)
+        total = len(catalog)
+        return np.arange(total if limit is None else min(limit, total), dtype=np.int32), total
+
+    @staticmethod
+    def _fuzzy_positions(
+        catalog: CatalogSnapshot,
+        query_normalized: str,
+        limit: Optional[int],
+        mask: Optional[np.ndarray] = None) -> List[int]:
+        """Vector-similarity matches, best first, for queries no indexed term
+        matches (typos, partial words such as "felpaa" or "giubbott")"""
+        return [
+            position
+            for position, _ in catalog.vectors.search(
+                normalize_name(query_normalized),
+                limit=limit,
+                accept=mask,
+                min_score=VECTOR_MIN_SCORE)
+        ]
 
-            if filters.season:
-                results = [
-                    p for p in results if filters.season.lower() in p.season.lower()
-                ]
+    def _text_matches(self, catalog: CatalogSnapshot, query_normalized: str) -> List[int]:
+        """Positions matching the query text, in no particular order"""
+        matches = list(catalog.search_index.score(query_normalized.split()))
+        return matches or self._fuzzy_positions(catalog, query_normalized, None)
 
-            if filters.style:
-                results = [
-                    p for p in results if filters.style.lower() in p.style.lower()
-                ]
+    def _price_sorted_positions(
+        self,
+        catalog: CatalogSnapshot,
+        query_normalized: str,
+        criteria: Dict[str, Any],
+        sort: str) -> np.ndarray:
+        """Matching positions in price order, read off the sorted price index"""
+        bounds = {
+            key: criteria[key] for key in ("price_min", "price_max") if key in criteria
+        }
+        mask = self._filter_mask(
+            catalog, {k: v for k, v in criteria.items() if k not in bounds}
+        )
+        if query_normalized.strip():
+            matches = np.zeros(len(catalog), dtype=bool)
+            matches[self._text_matches(catalog, query_normalized)] = True
+            mask = matches if mask is None else mask & matches
+        return catalog.columns.price_sorted(
+            descending=sort == ProductSort.PRICE_DESC.value, mask=mask, **bounds
+        )
 
-        return results[:limit]
+    def _view_positions(
+        self,
+        catalog: CatalogSnapshot,
+        query_normalized: str,
+        criteria: Dict[str, Any],
+        sort: str) -> np.ndarray:
+        """Matching positions in a materialized view's order; landing queries
+        (no text, no filters or just the view's own filter) are the view itself"""
+        if not query_normalized.strip():
+            materialized = catalog.views.materialized(sort, criteria)
+            if materialized is not None:
+                return materialized
+        order = catalog.views.order(sort)
+        mask = self._filter_mask(catalog, criteria)
+        if query_normalized.strip():
+            matches = np.zeros(len(catalog), dtype=bool)
+            matches[self._text_matches(catalog, query_normalized)] = True
+            mask = matches if mask is None else mask & matches
+        if mask is not None:
+            order = order[mask[order]]
+        return order
+
+    @staticmethod
+    def _canonical_sort(sort: Optional[ProductSort]) -> Optional[str]:
+        """Sort key, or None for the default relevance/catalog order"""
+        if sort is None or sort == ProductSort.RELEVANCE:
+            return None
+        return ProductSort(sort).value
+
+    def facet_counts(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[SearchFilters] = None) -> Dict[str, Any]:
+        """Facet value counts for the products matching query and filters"""
+        catalog = self.catalog
+        query_normalized = normalize_italian_terms(query.lower()) if query else ""
+        criteria = self._canonical_filters(filters)
+        cache_key = (
+            "facets",
+            catalog.version,
+            " ".join(query_normalized.split()),
+            tuple(sorted(criteria.items())),
+        )
+        facets = catalog.search_cache.get(cache_key)
+        if facets is None:
+            base = None
+            if query_normalized.strip():
+                base = np.zeros(len(catalog), dtype=bool)
+                base[self._text_matches(catalog, query_normalized)] = True
+            facets = catalog.columns.facet_counts(base, **criteria)
+            catalog.search_cache.set(cache_key, facets)
+        return facets
 
     def get_product_by_id(self, product_id: str) -> Optional[Product]:
         """Get single product by ID"""
-        for product in self.products:
-            if product.id == product_id:
-                return product
-        return None
+        catalog = self.catalog
+        position = catalog.positions_by_id.get(product_id)
+        if position is None:
+            return None
+        return catalog.products[position]
+
+    def get_products_by_ids(
+        self, product_ids: Iterable[str]
+    ) -> Tuple[List[Product], List[str]]:
+        """Products of ``product_ids`` in request order (repeats once), plus
+        the ids not in the catalog, resolved on one snapshot"""
+        catalog = self.catalog
+        products: List[Product] = []
+        missing: List[str] = []
+        seen: Set[str] = set()
+        for product_id in product_ids:
+            if product_id in seen:
+                continue
+            seen.add(product_id)
+            position = catalog.positions_by_id.get(product_id)
+            if position is None:
+                missing.append(product_id)
+            else:
+                products.append(catalog.products[position])
+        return products, missing
+
+    def products_json(
+        self, products: Iterable[Product], fields: Optional[FrozenSet[str]] = None
+    ) -> bytes:
+        """JSON array of ``products`` (projected to ``fields``) spliced from the
+        pre-serialized payloads"""
+        catalog = self.catalog
+        return json_array(catalog.product_json(product, fields) for product in products)
+
+    def match_product_names(
+        self, name: str, limit: int = 5, cutoff: float = 0.5
+    ) -> List[Tuple[Product, float]]:
+        """Products whose name is closest to ``name`` (typo tolerant)"""
+        catalog = self.catalog
+        return [
+            (catalog.products[position], similarity)
+            for position, similarity in catalog.name_index.match(name, limit, cutoff)
+        ]
+
+    def get_variant(
+        self, product_id: str, size: str, color: str
+    ) -> Optional[ProductVariant]:
+        """Get a product variant by size and (case-insensitive) color"""
+        catalog = self.catalog
+        entry = catalog.variants_by_key.get(catalog.variant_key(product_id, size, color))
+        if entry is None:
+            return None
+        position, index = entry
+        return catalog.products[position].variants[index]
 
     def check_variant_availability(
         self, product_id: str, size: str, color: str
     ) -> bool:
         """Check if specific variant is available"""
-        product = self.get_product_by_id(product_id)
-        if not product:
+        catalog = self.catalog
+        position = catalog.positions_by_id.get(product_id)
+        if position is None:
             return False
-
-        for variant in product.variants:
-            if variant.size.value == size and variant.color.lower() == color.lower():
-                return True if variant.available else False
-        return False
+        return catalog.columns.is_available(position, size, color)
+
+    def available_options(self, product_id: str) -> Optional[Tuple[List[str], List[str]]]:
+        """``(sizes, colors)`` currently in stock for a product, from the bitsets"""
+        catalog = self.catalog
+        position = catalog.positions_by_id.get(product_id)
+        if position is None:
+            return None
+        return (
+            catalog.columns.available_sizes(position),
+            catalog.columns.available_colors(position),
+        )
 
     def add_to_cart(
         self,
@@ -2106,13 +1390,7 @@ class DataStore:
             raise HTTPException(status_code=404, detail="Prodotto non trovato")
 
         # Check variant availability
-        variant_found = False
-        for variant in product.variants:
-            if variant.size.value == size and variant.color.lower() == color.lower():
-                variant_found = True
-                break
-
-        if not variant_found:
+        if self.get_variant(product_id, size, color) is None:
             raise HTTPException(status_code=400, detail="Variante non trovata")
 
         cart = self.get_cart(session_id)
@@ -2190,55 +1468,34 @@ class DataStore:
         product_id: Optional[str] = None,
         category: Optional[str] = None,
         style: Optional[str] = None,
-        limit: int = 3) -> List[Product]:
+        limit: int = 3,
+        mode: RecommendationMode = RecommendationMode.OUTFIT) -> List[Product]:
         """Get smart product recommendations"""
         recommendations = []
 
-        if product_id:
-            product = self.get_product_by_id(product_id)
-            if product:
-                # Get complementary items
-                if product.category == ProductCategory.TSHIRT:
-                    # Recommend pants and shoes
-                    recommendations.extend(
-                        self.search_products(
-                            filters=SearchFilters(category="pantaloni"), limit=1
-                        )
-                    )
-                    recommendations.extend(
-                        self.search_products(
-                            filters=SearchFilters(category="scarpe"), limit=1
-                        )
+        if product_id and mode == RecommendationMode.SIMILAR:
+            catalog = self.catalog
+            position = catalog.positions_by_id.get(product_id)
+            if position is not None:
+                cache_key = ("similar", catalog.version, position, limit)
+                similar = catalog.search_cache.get(cache_key)
+                if similar is None:
+                    similar = tuple(
+                        candidate
+                        for candidate, _ in catalog.vectors.similar(position, limit=max(limit, 0))
                     )
-                elif product.category == ProductCategory.PANTALONI:
-                    # Recommend shirts and shoes
-                    recommendations.extend(
-                        self.search_products(
-                            filters=SearchFilters(category="camicia"), limit=1
-                        )
-                    )
-                    recommendations.extend(
-                        self.search_products(
-                            filters=SearchFilters(category="scarpe"), limit=1
-                        )
-                    )
-                elif product.category == ProductCategory.SCARPE:
-                    # Recommend matching accessories
-                    recommendations.extend(
-                        self.search_products(
-                            filters=SearchFilters(category="accessori"), limit=2
-                        )
-                    )
-
-                # Add similar items from same category
-                similar = [
-                    p
-                    for p in self.products
-                    if p.category == product.category
-                    and p.id != product_id
-                    and p.gender == product.gender
+                    catalog.search_cache.set(cache_key, similar)
+                recommendations = [catalog.products[candidate] for candidate in similar]
+
+        elif product_id:
+            # Complementary outfit items, then similar ones (precomputed)
+            catalog = self.catalog
+            position = catalog.positions_by_id.get(product_id)
+            if position is not None:
+                recommendations = [
+                    catalog.products[candidate]
+                    for candidate in catalog.recommendations.for_product(position, limit)
                 ]
-                recommendations.extend(similar[: limit - len(recommendations)])
 
         elif category:
             cat_normalized = normalize_italian_terms(category.lower())
@@ -2252,60 +1509,25 @@ class DataStore:
             ][:limit]
 
         else:
-            # Return best sellers (highest reviews)
-            recommendations = sorted(
-                self.products, key=lambda p: p.reviews, reverse=True
-            )[:limit]
+            # Return best sellers (highest reviews), materialized per snapshot
+            catalog = self.catalog
+            recommendations = [
+                catalog.products[position]
+                for position in catalog.views.popular[: max(limit, 0)].tolist()
+            ]
 
         return recommendations[:limit]
 
-    def get_size_guide(self, category: str) -> Dict[str, Any]:
-        """Get size guide for category"""
-        guides = {
-            "tshirt": {
-                "uomo": {
-                    "XS": "44-46",
-                    "S": "46-48",
-                    "M": "48-50",
-                    "L": "50-52",
-                    "XL": "52-54",
-                    "XXL": "54-56",
-                },
-                "donna": {
-                    "XS": "38-40",
-                    "S": "40-42",
-                    "M": "42-44",
-                    "L": "44-46",
-                    "XL": "46-48",
-                    "XXL": "48-50",
-                },
-            },
-            "pantaloni": {
-                "uomo": {
-                    "XS": "44",
-                    "S": "46",
-                    "M": "48",
-                    "L": "50",
-                    "XL": "52",
-                    "XXL": "54",
-                },
-                "donna": {
-                    "XS": "38",
-                    "S": "40",
-                    "M": "42",
-                    "L": "44",
-                    "XL": "46",
-                    "XXL": "48",
-                },
-            },
-            "scarpe": {
-                "uomo": {"S": "39-40", "M": "41-42", "L": "43-44", "XL": "45-46"},
-                "donna": {"XS": "35-36", "S": "37-38", "M": "39-40", "L": "41-42"},
-            },
-        }
-
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def size_guide_key(category: str) -> str:
+        """Guide key for a spoken/typed category (memoized normalization)"""
         cat_normalized = normalize_italian_terms(category.lower())
-        return guides.get(cat_normalized, guides.get("tshirt"))
+        return cat_normalized if cat_normalized in DataStore.SIZE_GUIDES else "tshirt"
+
+    def get_size_guide(self, category: str) -> Dict[str, Any]:
+        """Get size guide for category (shared, do not mutate)"""
+        return self.SIZE_GUIDES[self.size_guide_key(category)]
 
 
 # Initialize data store
@@ -2375,6 +1597,9 @@ async def health_check():
         "timestamp": datetime.utcnow().isoformat(),
         "version": "2.0.0",
         "products_loaded": len(data_store.products),
+        "catalog_version": data_store.catalog_version,
+        "catalog_revision": data_store.catalog_revision,
+        "search_cache": data_store.search_cache.stats(),
         "categories": list(ProductCategory),
     }
 
@@ -2406,21 +1631,9 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                         current_product_details = serialize_product_for_ai(prod)
 
                 # Prodotti visibili (mappa id->name per open product by name)
-                visible_products_details = []
-                for pid in (client_ctx.get("visible_products") or [])[:24]:
-                    p = data_store.get_product_by_id(pid)
-                    if p:
-                        visible_products_details.append(
-                            {
-                                "id": p.id,
-                                "name": p.name,
-                                "category": p.category,
-                                "gender": p.gender,
-                                "price": p.price,
-                                "on_sale": p.on_sale,
-                                "discount": p.discount_percentage,
-                            }
-                        )
+                visible_products_details = visible_products_context(
+                    client_ctx.get("visible_products")
+                )
 
                 # Mappa normalizzata nome->id inviata dal client
                 visible_products_map = client_ctx.get("visible_products_map") or {}
@@ -2501,9 +1714,27 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
         manager.disconnect(websocket, session_id)
 
 
+def catalog_cache_headers(request: Request, catalog: CatalogSnapshot) -> Dict[str, str]:
+    """Validator and caching headers of a response derived from ``catalog``"""
+    return {
+        "ETag": catalog_etag(request, catalog.revision),
+        "Cache-Control": CATALOG_CACHE_CONTROL,
+        "X-Catalog-Version": catalog.revision,
+    }
+
+
+def requested_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Projection of a ``fields=`` query parameter (400 on unknown names)"""
+    try:
+        return parse_product_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Campo sconosciuto: {exc}")
+
+
 # Product Endpoints
 @app.get("/api/products", response_model=List[Product])
 async def get_products(
+    request: Request,
     q: Optional[str] = None,
     category: Optional[str] = None,
     gender: Optional[Gender] = None,
@@ -2513,8 +1744,22 @@ async def get_products(
     max_price: Optional[float] = None,
     on_sale: Optional[bool] = None,
     brand: Optional[str] = None,
-    limit: int = 20):
-    """Get products with advanced filtering"""
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    sort: Optional[ProductSort] = None,
+    fields: Optional[str] = None):
+    """Get products with advanced filtering.
+
+    Paginated with an opaque ``cursor``: the total hit count and the cursor
+    of the next page are returned in the X-Total-Count / X-Next-Cursor
+    headers. Cursors are bound to the catalog revision (409 once it changes),
+    and so is the ETag: ``If-None-Match`` gets a 304 until the catalog changes.
+    ``sort=price_asc|price_desc`` orders by price instead of relevance;
+    ``popular``, ``discount`` (on sale first) and ``newest`` read the
+    materialized catalog views. ``fields=card`` (or a comma-separated field
+    list) returns pre-serialized projections instead of full products.
+    """
+    projection = requested_fields(fields)
     filters = SearchFilters(
         category=category,
         gender=gender,
@@ -2525,16 +1770,92 @@ async def get_products(
         on_sale=on_sale,
         brand=brand)
 
-    return data_store.search_products(query=q, filters=filters, limit=limit)
+    headers = catalog_cache_headers(request, data_store.catalog)
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(request, headers)
+
+    try:
+        products, total, next_cursor = data_store.search_page(
+            query=q, filters=filters, limit=limit, cursor=cursor, sort=sort
+        )
+    except StaleCursorError:
+        raise HTTPException(
+            status_code=409,
+            detail="Il catalogo è cambiato, ricarica i risultati")
+    except CursorError:
+        raise HTTPException(status_code=400, detail="Cursore non valido")
+
+    headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return json_response(data_store.products_json(products, projection), headers)
+
+
+@app.get("/api/products/facets")
+async def get_product_facets(
+    request: Request,
+    q: Optional[str] = None,
+    category: Optional[str] = None,
+    gender: Optional[Gender] = None,
+    size: Optional[Size] = None,
+    color: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    on_sale: Optional[bool] = None,
+    brand: Optional[str] = None):
+    """Count matching products per category/gender/size/color/brand value"""
+    filters = SearchFilters(
+        category=category,
+        gender=gender,
+        size=size,
+        color=color,
+        price_min=min_price,
+        price_max=max_price,
+        on_sale=on_sale,
+        brand=brand)
+
+    headers = catalog_cache_headers(request, data_store.catalog)
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(request, headers)
+    return DefaultJSONResponse(
+        data_store.facet_counts(query=q, filters=filters), headers=headers
+    )
+
+
+@app.post("/api/products/batch")
+async def get_products_batch(payload: ProductBatchRequest):
+    """Resolve up to ``PRODUCT_BATCH_LIMIT`` ids in one round trip.
+
+    Returns ``{"products": [...], "missing": [...]}``: products in request
+    order (optionally projected with ``fields``), unknown ids in ``missing``.
+    """
+    projection = requested_fields(payload.fields)
+    products, missing = data_store.get_products_by_ids(payload.ids)
+    body = (
+        b'{"products":'
+        + data_store.products_json(products, projection)
+        + b',"missing":'
+        + json_bytes(missing)
+        + b"}"
+    )
+    return json_response(body)
 
 
 @app.get("/api/products/{product_id}", response_model=Product)
-async def get_product(product_id: str):
-    """Get single product with all details"""
-    product = data_store.get_product_by_id(product_id)
-    if not product:
+async def get_product(product_id: str, request: Request, fields: Optional[str] = None):
+    """Get single product with all details (or the ``fields`` projection)"""
+    projection = requested_fields(fields)
+    catalog = data_store.catalog
+    position = catalog.positions_by_id.get(product_id)
+    if position is None:
         raise HTTPException(status_code=404, detail="Prodotto non trovato")
-    return product
+    headers = catalog_cache_headers(request, catalog)
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(request, headers)
+    body, encoding = catalog.payloads_for(projection).encoded(
+        position, accepted_encoding(request)
+    )
+    return json_response(body, headers, encoding)
 
 
 @app.get("/api/products/{product_id}/availability")
@@ -2546,12 +1867,24 @@ async def check_availability(product_id: str, size: str, color: str):
 
 @app.get("/api/recommendations", response_model=List[Product])
 async def get_recommendations(
+    request: Request,
     product_id: Optional[str] = None,
     category: Optional[str] = None,
     style: Optional[str] = None,
-    limit: int = 3):
-    """Get smart product recommendations"""
-    return data_store.get_recommendations(product_id, category, style, limit)
+    limit: int = 3,
+    mode: RecommendationMode = RecommendationMode.OUTFIT,
+    fields: Optional[str] = None):
+    """Get smart product recommendations (``mode=similar``: "more like this")"""
+    projection = requested_fields(fields)
+    headers = catalog_cache_headers(request, data_store.catalog)
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(request, headers)
+    return json_response(
+        data_store.products_json(
+            data_store.get_recommendations(product_id, category, style, limit, mode),
+            projection,
+        ),
+        headers)
 
 
 # Cart Endpoints
@@ -2648,21 +1981,7 @@ async def voice_command(req: VoiceRequest, request: Request, response: Response)
         if prod:
             current_product_details = serialize_product_for_ai(prod)
 
-    visible_products_details = []
-    for pid in (client_ctx.get("visible_products") or [])[:24]:
-        p = data_store.get_product_by_id(pid)
-        if p:
-            visible_products_details.append(
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "category": p.category,
-                    "gender": p.gender,
-                    "price": p.price,
-                    "on_sale": p.on_sale,
-                    "discount": p.discount_percentage,
-                }
-            )
+    visible_products_details = visible_products_context(client_ctx.get("visible_products"))
 
     visible_products_map = client_ctx.get("visible_products_map") or {}
 
@@ -2777,113 +2096,144 @@ async def tts_endpoint(payload: TTSRequest, request: Request, response: Response
 
 
 # Information Endpoints
-@app.get("/api/size-guide/{category}")
-async def get_size_guide(category: str):
-    """Get size guide for category"""
-    return data_store.get_size_guide(category)
-
-
-@app.get("/api/shipping-info")
-async def get_shipping_info():
-    """Get shipping information"""
-    return {
-        "free_shipping_threshold": 100.0,
-        "standard_shipping": {
-            "price": 9.90,
-            "delivery_window": "3-5 giorni lavorativi",
-            "carrier": "BRT o GLS",
-        },
-        "express_shipping": {
-            "price": 19.90,
-            "delivery_window": "1-2 giorni lavorativi",
-            "carrier": "DHL Express",
-        },
-        "shipping_zones": [
-            {
-                "zone": "Italia continentale",
-                "standard": {
-                    "price": 9.90,
-                    "delivery_window": "3-5 giorni lavorativi",
-                    "carrier": "BRT o GLS",
-                },
-                "express": {
-                    "price": 19.90,
-                    "delivery_window": "1-2 giorni lavorativi",
-                    "carrier": "DHL Express",
-                },
-                "notes": [
-                    "Consegna serale disponibile su Milano e hinterland",
-                    "Tracking in tempo reale incluso",
-                ],
+SHIPPING_INFO: Dict[str, Any] = {
+    "free_shipping_threshold": 100.0,
+    "standard_shipping": {
+        "price": 9.90,
+        "delivery_window": "3-5 giorni lavorativi",
+        "carrier": "BRT o GLS",
+    },
+    "express_shipping": {
+        "price": 19.90,
+        "delivery_window": "1-2 giorni lavorativi",
+        "carrier": "DHL Express",
+    },
+    "shipping_zones": [
+        {
+            "zone": "Italia continentale",
+            "standard": {
+                "price": 9.90,
+                "delivery_window": "3-5 giorni lavorativi",
+                "carrier": "BRT o GLS",
             },
-            {
-                "zone": "Isole maggiori e Calabria",
-                "standard": {
-                    "price": 12.90,
-                    "delivery_window": "4-6 giorni lavorativi",
-                    "carrier": "BRT o GLS",
-                },
-                "express": {
-                    "price": 24.90,
-                    "delivery_window": "2-3 giorni lavorativi",
-                    "carrier": "DHL Express",
-                },
-                "notes": ["I tempi possono estendersi di 24h in alta stagione"],
+            "express": {
+                "price": 19.90,
+                "delivery_window": "1-2 giorni lavorativi",
+                "carrier": "DHL Express",
             },
-        ],
-        "pickup_point": {
-            "enabled": True,
-            "location": "Boutique AIVA Milano Porta Nuova",
-            "price": 0.0,
-            "delivery_window": "Pronto al ritiro entro 24 ore lavorative",
+            "notes": [
+                "Consegna serale disponibile su Milano e hinterland",
+                "Tracking in tempo reale incluso",
+            ],
         },
-        "saturday_delivery": {
-            "enabled": True,
-            "price": 24.90,
-            "area": "Milano e hinterland",
-            "cutoff": "Ordina entro le 12:00 del venerdì",
+        {
+            "zone": "Isole maggiori e Calabria",
+            "standard": {
+                "price": 12.90,
+                "delivery_window": "4-6 giorni lavorativi",
+                "carrier": "BRT o GLS",
+            },
+            "express": {
+                "price": 24.90,
+                "delivery_window": "2-3 giorni lavorativi",
+                "carrier": "DHL Express",
+            },
+            "notes": ["I tempi possono estendersi di 24h in alta stagione"],
         },
-        "returns": {
-            "policy": "Reso gratuito entro 30 giorni",
-            "instructions": "Prenota il ritiro gratuito dal tuo account o visita la boutique con la ricevuta.",
+    ],
+    "pickup_point": {
+        "enabled": True,
+        "location": "Boutique AIVA Milano Porta Nuova",
+        "price": 0.0,
+        "delivery_window": "Pronto al ritiro entro 24 ore lavorative",
+    },
+    "saturday_delivery": {
+        "enabled": True,
+        "price": 24.90,
+        "area": "Milano e hinterland",
+        "cutoff": "Ordina entro le 12:00 del venerdì",
+    },
+    "returns": {
+        "policy": "Reso gratuito entro 30 giorni",
+        "instructions": "Prenota il ritiro gratuito dal tuo account o visita la boutique con la ricevuta.",
+    },
+    "insurance": {
+        "included": True,
+        "description": "Copertura danni e smarrimento inclusa in tutte le spedizioni",
+    },
+    "customer_service": {
+        "email": "supporto@aiva-fashion.demo",
+        "phone": "+39 02 1234 5678",
+        "hours": "Lun-Ven 9:00-18:00",
+    },
+    "last_update": "2024-02-15",
+}
+
+PROMOTIONS: Dict[str, Any] = {
+    "promotions": [
+        {
+            "id": "promo1",
+            "title": "Saldi Invernali",
+            "description": "Fino al 50% su tutta la collezione invernale",
+            "valid_until": "2025-02-28",
         },
-        "insurance": {
-            "included": True,
-            "description": "Copertura danni e smarrimento inclusa in tutte le spedizioni",
+        {
+            "id": "promo2",
+            "title": "Spedizione Gratuita",
+            "description": "Spedizione gratuita per ordini sopra i 100€",
+            "valid_until": "2025-12-31",
         },
-        "customer_service": {
-            "email": "supporto@aiva-fashion.demo",
-            "phone": "+39 02 1234 5678",
-            "hours": "Lun-Ven 9:00-18:00",
+        {
+            "id": "promo3",
+            "title": "3x2 T-Shirt",
+            "description": "Prendi 3 t-shirt e paghi solo 2",
+            "valid_until": "2025-03-31",
         },
-        "last_update": "2024-02-15",
-    }
+    ]
+}
+
+# Informational payloads are serialized once (they change only with a deploy)
+SIZE_GUIDE_RESPONSES = {
+    key: PreparedJSON(guide) for key, guide in DataStore.SIZE_GUIDES.items()
+}
+SHIPPING_INFO_RESPONSE = PreparedJSON(SHIPPING_INFO)
+PROMOTIONS_RESPONSE = PreparedJSON(PROMOTIONS)
+
+
+@app.get("/api/size-guide/{category}")
+async def get_size_guide(category: str, request: Request):
+    """Get size guide for category"""
+    return SIZE_GUIDE_RESPONSES[DataStore.size_guide_key(category)].response(request)
+
+
+@app.get("/api/shipping-info")
+async def get_shipping_info(request: Request):
+    """Get shipping information"""
+    return SHIPPING_INFO_RESPONSE.response(request)
 
 
 @app.get("/api/promotions")
-async def get_current_promotions():
+async def get_current_promotions(request: Request):
     """Get current promotions"""
+    return PROMOTIONS_RESPONSE.response(request)
+
+
+# Admin Endpoints
+@app.post("/api/admin/catalog/reload", dependencies=[Depends(require_api_key)])
+async def reload_catalog():
+    """Reload the catalog source and swap in a freshly indexed snapshot"""
+    try:
+        catalog = await data_store.reload_catalog()
+    except Exception as exc:
+        logger.error(
+            f"Catalog reload failed, keeping version {data_store.catalog_version}: {exc}"
+        )
+        raise HTTPException(status_code=500, detail="Ricaricamento catalogo fallito")
     return {
-        "promotions": [
-            {
-                "id": "promo1",
-                "title": "Saldi Invernali",
-                "description": "Fino al 50% su tutta la collezione invernale",
-                "valid_until": "2025-02-28",
-            },
-            {
-                "id": "promo2",
-                "title": "Spedizione Gratuita",
-                "description": "Spedizione gratuita per ordini sopra i 100€",
-                "valid_until": "2025-12-31",
-            },
-            {
-                "id": "promo3",
-                "title": "3x2 T-Shirt",
-                "description": "Prendi 3 t-shirt e paghi solo 2",
-                "valid_until": "2025-03-31",
-            },
-        ]
+        "status": "reloaded",
+        "catalog_version": catalog.version,
+        "catalog_revision": catalog.revision,
+        "products_loaded": len(catalog),
     }
 
 
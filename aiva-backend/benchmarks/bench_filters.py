@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+Filter engine benchmark: columnar NumPy masks vs. the legacy list comprehensions.
+Run with: python benchmarks/bench_filters.py [--sizes 1000 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.INFO)
+
+from app import (  # noqa: E402
+    DataStore,
+    Gender,
+    Product,
+    SearchFilters,
+    Size,
+    data_store,
+    normalize_italian_terms)
+
+FILTER_CASES = {
+    "category": SearchFilters(category="pantaloni"),
+    "gender+size": SearchFilters(gender=Gender.DONNA, size=Size.M),
+    "color+price": SearchFilters(color="nero", price_max=80),
+    "on_sale+category": SearchFilters(on_sale=True, category="scarpe"),
+    "all": SearchFilters(
+        category="felpa",
+        gender=Gender.UOMO,
+        size=Size.L,
+        color="nero",
+        price_min=20,
+        price_max=150,
+        on_sale=False,
+        style="casual"),
+}
+
+
+def scaled_catalog(size: int) -> List[Product]:
+    """Repeat the demo catalog with unique ids and jittered prices."""
+    seed = data_store.products
+    products: List[Product] = []
+    for i in range(size):
+        template = seed[i % len(seed)]
+        price = round(template.price * (0.8 + (i % 7) * 0.05), 2)
+        products.append(
+            template.model_copy(
+                update={"id": f"{template.id}-{i}", "price": price}
+            )
+        )
+    return products
+
+
+def legacy_filter(results: List[Product], filters: SearchFilters) -> List[Product]:
+    """Copy of the list-comprehension filter path replaced by CatalogColumns."""
+    if filters.category:
+        cat_normalized = normalize_italian_terms(filters.category.lower())
+        results = [
+            p
+            for p in results
+            if cat_normalized in p.category.value.lower()
+            or cat_normalized in p.subcategory.lower()
+        ]
+    if filters.gender:
+        results = [
+            p for p in results if p.gender == filters.gender or p.gender == Gender.UNISEX
+        ]
+    if filters.size:
+        results = [
+            p
+            for p in results
+            if any(v.size == filters.size and v.available for v in p.variants)
+        ]
+    if filters.color:
+        color_lower = filters.color.lower()
+        results = [
+            p for p in results if any(color_lower in v.color.lower() for v in p.variants)
+        ]
+    if filters.price_min is not None:
+        results = [p for p in results if p.price >= filters.price_min]
+    if filters.price_max is not None:
+        results = [p for p in results if p.price <= filters.price_max]
+    if filters.on_sale is not None:
+        results = [p for p in results if p.on_sale == filters.on_sale]
+    if filters.brand:
+        results = [p for p in results if filters.brand.lower() in p.brand.lower()]
+    if filters.season:
+        results = [p for p in results if filters.season.lower() in p.season.lower()]
+    if filters.style:
+        results = [p for p in results if filters.style.lower() in p.style.lower()]
+    return results
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'catalog':>8}  {'filters':<18}{'legacy ms':>11}{'numpy ms':>10}{'speedup':>9}")
+    for size in args.sizes:
+        products = scaled_catalog(size)
+        store = DataStore(products=products)
+        for name, filters in FILTER_CASES.items():
+            expected = [p.id for p in legacy_filter(products, filters)]
+            actual = [p.id for p in store.search_products(filters=filters, limit=size)]
+            if expected != actual:
+                raise SystemExit(f"Result mismatch for '{name}' at {size} products")
+
+            legacy_ms = best_of(lambda: legacy_filter(products, filters), args.repeat)
+            numpy_ms = best_of(
+                lambda: store.search_products(filters=filters, limit=size), args.repeat
+            )
+            print(
+                f"{size:>8}  {name:<18}{legacy_ms:>11.2f}{numpy_ms:>10.2f}"
+                f"{legacy_ms / max(numpy_ms, 1e-9):>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+"""
+Catalog scaling benchmark: p50/p95 latency and memory per workload and size.
+
+Builds a DataStore over a synthetic catalog (see catalog_generator.py) for
+each size and times search (including the vector fallback), filtering,
+pagination, recommendations and lookups, plus the /api/products endpoint
+end to end. Results are written as JSON so runs from different commits can
+be compared:
+
+    python benchmarks/bench_suite.py --sizes 10000 100000
+    python benchmarks/bench_suite.py --compare benchmarks/results/<baseline>.json
+
+A million products need roughly 20 GB of RAM (pass ``--sizes 1000000``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.INFO)
+
+import numpy as np  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app as aiva  # noqa: E402
+from app import (  # noqa: E402
+    DataStore,
+    Gender,
+    ProductSort,
+    RecommendationMode,
+    SearchFilters,
+    Size)
+from catalog_generator import DEFAULT_SEED, generate_catalog  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+QUERIES = [
+    "felpa",
+    "jeans slim",
+    "giacca pelle nera",
+    "sneakers bianche",
+    "vestito elegante sera",
+]
+
+# Misspelled queries no indexed term matches: answered by vector similarity
+FUZZY_QUERIES = [
+    "felpaa",
+    "jeens",
+    "sneakr bianche",
+    "giubbott",
+]
+
+# Short terms and Italian stopwords, which used to scan the whole vocabulary
+SHORT_TERM_QUERIES = [
+    "a",
+    "maglia a righe",
+    "giacca di pelle",
+    "ma",
+]
+
+FILTERS = [
+    SearchFilters(category="pantaloni"),
+    SearchFilters(gender=Gender.DONNA, size=Size.M),
+    SearchFilters(color="nero", price_max=80),
+    SearchFilters(on_sale=True, category="scarpe"),
+    SearchFilters(category="felpa", gender=Gender.UOMO, size=Size.L, color="nero"),
+]
+
+Workload = Callable[[int], object]
+
+
+def git_revision() -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR,
+            capture_output=True,
+            text=True,
+            check=True).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=BENCH_DIR,
+            capture_output=True,
+            text=True,
+            check=True).stdout.strip()
+        return f"{revision}-dirty" if dirty else revision
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def rss_mb() -> float:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def measure(workload: Workload, iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """Latency percentiles over ``iterations`` calls and the peak allocation of one."""
+    for i in range(warmup):
+        workload(i)
+    timings = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        workload(i)
+        timings[i] = time.perf_counter() - start
+    timings *= 1000
+
+    tracemalloc.start()
+    workload(iterations)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "p50_ms": round(float(np.percentile(timings, 50)), 4),
+        "p95_ms": round(float(np.percentile(timings, 95)), 4),
+        "mean_ms": round(float(timings.mean()), 4),
+        "peak_alloc_kib": round(peak / 1024, 1),
+    }
+
+
+def workloads(store: DataStore, client: TestClient, seed: int) -> Dict[str, Workload]:
+    rng = random.Random(seed)
+    products = store.products
+    sample = [products[rng.randrange(len(products))] for _ in range(256)]
+    variants = [(p.id, p.variants[0].size.value, p.variants[0].color) for p in sample]
+
+    def cold(run: Callable[[int], object]) -> Workload:
+        def workload(i: int) -> object:
+            store.search_cache.clear()
+            return run(i)
+
+        return workload
+
+    # Cursor into the middle of the full listing (its ranked window is cached)
+    _, _, middle = store.search_page(limit=len(products) // 2)
+
+    return {
+        "search": cold(lambda i: store.search_products(QUERIES[i % len(QUERIES)], limit=20)),
+        "search_cached": lambda i: store.search_products(QUERIES[i % len(QUERIES)], limit=20),
+        "filter": cold(lambda i: store.search_products(filters=FILTERS[i % len(FILTERS)], limit=20)),
+        "search_and_filter": cold(
+            lambda i: store.search_products(
+                QUERIES[i % len(QUERIES)], filters=FILTERS[i % len(FILTERS)], limit=20
+            )
+        ),
+        "search_fuzzy": cold(
+            lambda i: store.search_products(FUZZY_QUERIES[i % len(FUZZY_QUERIES)], limit=20)
+        ),
+        "search_short_terms": cold(
+            lambda i: store.search_products(
+                SHORT_TERM_QUERIES[i % len(SHORT_TERM_QUERIES)], limit=20
+            )
+        ),
+        "facets": cold(lambda i: store.facet_counts(filters=FILTERS[i % len(FILTERS)])),
+        "offers_landing": cold(
+            lambda i: store.search_products(
+                filters=SearchFilters(on_sale=True), limit=20, sort=ProductSort.DISCOUNT
+            )
+        ),
+        "best_sellers": lambda i: store.get_recommendations(limit=10),
+        "page_deep": lambda i: store.search_page(limit=20, cursor=middle),
+        "recommendations": cold(
+            lambda i: store.get_recommendations(product_id=sample[i % len(sample)].id)
+        ),
+        "more_like_this": cold(
+            lambda i: store.get_recommendations(
+                product_id=sample[i % len(sample)].id, mode=RecommendationMode.SIMILAR
+            )
+        ),
+        "product_lookup": lambda i: store.get_product_by_id(sample[i % len(sample)].id),
+        "variant_availability": lambda i: store.check_variant_availability(
+            *variants[i % len(variants)]
+        ),
+        "api_products": cold(
+            lambda i: client.get("/api/products", params={"q": QUERIES[i % len(QUERIES)]})
+        ),
+        "api_products_card": cold(
+            lambda i: client.get(
+                "/api/products", params={"q": QUERIES[i % len(QUERIES)], "fields": "card"}
+            )
+        ),
+        "api_product_detail": lambda i: client.get(f"/api/products/{sample[i % len(sample)].id}"),
+    }
+
+
+def run_size(size: int, seed: int, iterations: int) -> Dict[str, Any]:
+    baseline_rss = rss_mb()
+    start = time.perf_counter()
+    products = generate_catalog(size, seed)
+    generate_s = time.perf_counter() - start
+    products_rss = rss_mb()
+
+    start = time.perf_counter()
+    store = DataStore(products=products)
+    index_s = time.perf_counter() - start
+    del products
+
+    # Serve the endpoint from the synthetic catalog
+    aiva.data_store.catalog = store.catalog
+    client = TestClient(aiva.app)
+
+    results = {
+        "size": size,
+        "build": {
+            "generate_s": round(generate_s, 3),
+            "index_s": round(index_s, 3),
+            "products_rss_mb": round(products_rss - baseline_rss, 1),
+            "indexes_rss_mb": round(rss_mb() - products_rss, 1),
+        },
+        "workloads": {},
+    }
+    for name, workload in workloads(store, client, seed).items():
+        results["workloads"][name] = measure(workload, iterations)
+        stats = results["workloads"][name]
+        print(
+            f"{size:>8}  {name:<22}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+            f"{stats['peak_alloc_kib']:>12.1f}"
+        )
+    return results
+
+
+def compare(current: Dict[str, Any], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    previous = {run["size"]: run["workloads"] for run in baseline["results"]}
+    print(f"\np95 vs {baseline['meta']['revision']} ({baseline_path}):")
+    for run in current["results"]:
+        before = previous.get(run["size"], {})
+        for name, stats in run["workloads"].items():
+            if name in before and before[name]["p95_ms"]:
+                ratio = stats["p95_ms"] / before[name]["p95_ms"]
+                print(f"{run['size']:>8}  {name:<22}{ratio:>8.2f}x")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="JSON results path (default: results/<revision>.json)")
+    parser.add_argument("--compare", help="Previous results file to compare p95 against")
+    args = parser.parse_args(argv)
+
+    revision = git_revision()
+    report: Dict[str, Any] = {
+        "meta": {
+            "revision": revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "iterations": args.iterations,
+        },
+        "results": [],
+    }
+
+    print(f"{'catalog':>8}  {'workload':<22}{'p50 ms':>10}{'p95 ms':>10}{'peak KiB':>12}")
+    for size in args.sizes:
+        report["results"].append(run_size(size, args.seed, args.iterations))
+
+    output = args.output or os.path.join(BENCH_DIR, "results", f"{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Synonym matching microbenchmark: PhraseMatcher vs. the legacy per-synonym loops.
+Run with: python benchmarks/bench_synonyms.py [--repeat 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.INFO)
+
+from ai_service import CATEGORY_SYNONYMS, detect_category_from_text  # noqa: E402
+from app import SYNONYM_MAP, data_store, normalize_italian_terms  # noqa: E402
+
+VOICE_COMMANDS = [
+    "mostrami una felpa con cappuccio nera da uomo",
+    "vorrei delle scarpe da ginnastica bianche",
+    "cerco un giubbotto o un piumino per l'inverno",
+    "fammi vedere le minigonne in offerta",
+    "aggiungi due pezzi taglia m colore blu",
+]
+
+
+def legacy_normalize(text: str) -> str:
+    text_lower = text.lower()
+    for synonym, category in SYNONYM_MAP.items():
+        if synonym in text_lower:
+            text_lower = text_lower.replace(synonym, category)
+    return text_lower
+
+
+def legacy_detect_category(text_lower: str) -> Optional[Tuple[str, str]]:
+    matched_phrase = ""
+    matched_category: Optional[str] = None
+    for phrase, canonical in CATEGORY_SYNONYMS.items():
+        if phrase in text_lower and len(phrase) >= len(matched_phrase):
+            matched_phrase = phrase
+            matched_category = canonical
+    if matched_category:
+        return matched_category, matched_phrase
+    return None
+
+
+def per_call_us(fn: Callable[[str], object], texts: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    catalog_texts = [
+        f"{p.name} {p.brand} {p.description} {p.subcategory} {' '.join(p.tags)}"
+        for p in data_store.products
+    ]
+    cases = [
+        ("normalize (catalog text)", legacy_normalize, normalize_italian_terms, catalog_texts),
+        ("normalize (voice command)", legacy_normalize, normalize_italian_terms, VOICE_COMMANDS),
+        ("detect category", legacy_detect_category, detect_category_from_text, VOICE_COMMANDS),
+    ]
+
+    print(f"{'case':<28}{'legacy us':>11}{'matcher us':>12}{'speedup':>9}")
+    for name, legacy_fn, new_fn, texts in cases:
+        legacy_us = per_call_us(legacy_fn, texts, args.repeat)
+        new_us = per_call_us(new_fn, texts, args.repeat)
+        print(f"{name:<28}{legacy_us:>11.2f}{new_us:>12.2f}{legacy_us / new_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
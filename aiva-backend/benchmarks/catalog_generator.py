@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""
+Deterministic synthetic catalog for scale testing.
+
+Products are derived from the hand-written catalog: every generated item
+starts from one of its products (category, subcategory, gender, season,
+style, base price) and gets a new name, brand, color palette, size run,
+price and sale flag from a seeded RNG, so the same ``size``/``seed`` always
+yields the same catalog. Models are built with ``model_construct`` to skip
+validation, which would dominate generation time at a million products.
+
+Run with: python benchmarks/catalog_generator.py 10000 [--seed 42] [--output catalog.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.INFO)
+
+from app import Product, ProductVariant, Size, data_store  # noqa: E402
+
+DEFAULT_SEED = 42
+
+ADJECTIVES = [
+    "Classico", "Slim", "Oversize", "Vintage", "Elegante", "Essenziale",
+    "Urban", "Premium", "Leggero", "Morbido", "Sartoriale", "Sportivo",
+    "Comfort", "Chic", "Minimal", "Riviera", "Milano", "Capri",
+]
+MATERIALS = [
+    "Cotone", "Lino", "Lana", "Cashmere", "Seta", "Denim", "Pelle",
+    "Jersey", "Velluto", "Piquet", "Tecnico", "Raso", "Viscosa",
+]
+BRAND_PREFIXES = [
+    "Atelier", "Casa", "Bottega", "Studio", "Officina", "Maison", "Sartoria",
+]
+BRAND_SUFFIXES = [
+    "Roma", "Torino", "Napoli", "Firenze", "Venezia", "Bologna", "Como",
+    "Verona", "Lecce", "Parma", "Genova", "Siena",
+]
+FEATURES = [
+    "Traspirante", "Elasticizzato", "Antipiega", "Impermeabile",
+    "Made in Italy", "Fodera interna", "Tessuto riciclato", "Vestibilità regular",
+]
+SIZES: List[Size] = list(Size)
+
+
+def _palette() -> List[Tuple[str, str]]:
+    """Distinct (color, color_code) pairs used by the seed catalog."""
+    seen: Dict[str, str] = {}
+    for product in data_store.products:
+        for variant in product.variants:
+            seen.setdefault(variant.color, variant.color_code)
+    return sorted(seen.items())
+
+
+def iter_products(size: int, seed: int = DEFAULT_SEED) -> Iterator[Product]:
+    """Yield ``size`` synthetic products, deterministically for a given seed."""
+    rng = random.Random(seed)
+    templates: Sequence[Product] = data_store.products
+    palette = _palette()
+    brands = [f"{prefix} {suffix}" for prefix in BRAND_PREFIXES for suffix in BRAND_SUFFIXES]
+    brands.extend(sorted({p.brand for p in templates}))
+
+    for i in range(size):
+        template = templates[rng.randrange(len(templates))]
+        noun = template.name.split()[0]
+        adjective = rng.choice(ADJECTIVES)
+        material = rng.choice(MATERIALS)
+        name = f"{noun} {adjective} {material}"
+
+        original_price = round(template.original_price * rng.uniform(0.6, 1.8), 2)
+        on_sale = rng.random() < 0.15
+        discount = rng.choice((10, 20, 30, 40, 50)) if on_sale else 0
+        price = round(original_price * (1 - discount / 100), 2)
+
+        first_size = rng.randrange(len(SIZES) - 2)
+        run = SIZES[first_size : first_size + rng.randint(2, len(SIZES) - first_size)]
+        colors = rng.sample(palette, rng.randint(1, 3))
+        variants = [
+            ProductVariant.model_construct(
+                size=variant_size,
+                color=color,
+                color_code=code,
+                available=rng.random() < 0.85)
+            for color, code in colors
+            for variant_size in run
+        ]
+
+        color_words = {word.lower() for color, _ in colors for word in color.split("/")}
+        yield Product.model_construct(
+            id=f"gen-{seed}-{i:07d}",
+            name=name,
+            brand=rng.choice(brands),
+            description=f"{noun} {adjective.lower()} in {material.lower()}, {template.style.lower()}",
+            description_long=(
+                f"{name}: {template.description_long} "
+                f"Realizzato in {material.lower()}, disponibile in "
+                f"{', '.join(color for color, _ in colors)}."
+            ),
+            category=template.category,
+            subcategory=template.subcategory,
+            gender=template.gender,
+            price=price,
+            original_price=original_price,
+            discount_percentage=discount,
+            on_sale=on_sale,
+            materials=[f"100% {material}"],
+            care_instructions=template.care_instructions,
+            season=template.season,
+            style=template.style,
+            variants=variants,
+            images=list(template.images),
+            features=rng.sample(FEATURES, 3),
+            rating=round(rng.uniform(3.5, 5.0), 1),
+            reviews=int(rng.paretovariate(1.2) * 10),
+            tags=sorted(set(template.tags) | color_words | {material.lower()}))
+
+
+def generate_catalog(size: int, seed: int = DEFAULT_SEED) -> List[Product]:
+    return list(iter_products(size, seed))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--output",
+        help="Write a data/catalog.json compatible file (usable via CATALOG_PATH)")
+    args = parser.parse_args()
+
+    products = generate_catalog(args.size, args.seed)
+    payload = {
+        "version": 1,
+        "sale_ids": [p.id for p in products if p.on_sale],
+        "products": [p.model_dump(mode="json") for p in products],
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False)
+        print(f"Wrote {len(products)} products to {args.output}")
+    else:
+        json.dump(payload, sys.stdout, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
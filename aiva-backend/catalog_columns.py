@@ -0,0 +1,408 @@
+"""Columnar NumPy view of the catalog used to evaluate search filters."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from color_families import color_families, family_of_name, normalize_color
+
+
+def _encode(values: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    """Dictionary-encode ``values`` into integer codes plus their vocabulary."""
+    vocabulary: Dict[str, int] = {}
+    codes = np.fromiter(
+        (vocabulary.setdefault(value, len(vocabulary)) for value in values),
+        dtype=np.int32,
+        count=len(values))
+    return codes, list(vocabulary)
+
+
+def _bitmask_dtype(width: int) -> np.dtype:
+    """Smallest unsigned integer type with at least ``width`` bits."""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if width <= np.iinfo(dtype).bits:
+            return np.dtype(dtype)
+    raise ValueError(f"Products with more than 64 colors are not supported ({width})")
+
+
+def _vocabulary_mask(
+    codes: np.ndarray, vocabulary: Sequence[str], predicate: Callable[[str], bool]
+) -> np.ndarray:
+    """Evaluate ``predicate`` once per distinct value and broadcast it to rows."""
+    lookup = np.fromiter(
+        (predicate(value) for value in vocabulary), dtype=bool, count=len(vocabulary)
+    )
+    if not len(lookup):
+        return np.zeros(len(codes), dtype=bool)
+    return lookup[codes]
+
+
+class CatalogColumns:
+    """Column arrays aligned with catalog positions.
+
+    Scalar attributes are stored as NumPy arrays (dictionary-encoded for
+    strings), so a complete set of filters compiles to one boolean mask with
+    a handful of vectorized operations instead of one Python pass per filter.
+
+    Variants are stored as bitsets: ``product_colors[p, k]`` is the color id
+    of the k-th color of product ``p`` and bit ``k`` of ``stock[p, s]``
+    (``offered[p, s]``) tells whether size ``s`` in that color is in stock
+    (exists at all). Variant checks are then a couple of array reads and stock
+    updates only rewrite ``stock``.
+
+    Every color is also mapped to its canonical families (see
+    :mod:`color_families`) at build time, with a posting list of the
+    positions offering each family, so color filters are dict lookups.
+    """
+
+    def __init__(self, products: Sequence[Any], sizes: Sequence[str]) -> None:
+        self.count = len(products)
+        self.sizes = list(sizes)
+        self._size_slots = {size: slot for slot, size in enumerate(self.sizes)}
+        size_slots = self._size_slots
+
+        self.price = np.fromiter(
+            (p.price for p in products), dtype=np.float64, count=self.count
+        )
+        # Positions ordered by price, ties in catalog order, for both directions;
+        # price ranges are answered by binary search over the sorted keys
+        self.price_order = np.argsort(self.price, kind="stable")
+        self._price_keys = self.price[self.price_order]
+        self.price_order_desc = np.argsort(-self.price, kind="stable")
+        self._price_keys_desc = -self.price[self.price_order_desc]
+        self.on_sale = np.fromiter(
+            (p.on_sale for p in products), dtype=bool, count=self.count
+        )
+        self.gender, self.genders = _encode([p.gender.value for p in products])
+        self.category, self.categories = _encode(
+            [p.category.value.lower() for p in products]
+        )
+        self.subcategory, self.subcategories = _encode(
+            [p.subcategory.lower() for p in products]
+        )
+        self.brand, self.brands = _encode([p.brand.lower() for p in products])
+        self.season, self.seasons = _encode([p.season.lower() for p in products])
+        self.style, self.styles = _encode([p.style.lower() for p in products])
+
+        # Lower-cased color -> id; labels keep the first spelling seen and
+        # codes the first hex code, which breaks family ties
+        self.color_ids: Dict[str, int] = {}
+        self.color_labels: List[str] = []
+        color_codes: List[Optional[str]] = []
+        product_colors: List[List[int]] = []
+        rows: List[int] = []
+        cols: List[int] = []
+        bits: List[int] = []
+        in_stock: List[bool] = []
+        for position, product in enumerate(products):
+            local: List[int] = []
+            for variant in product.variants:
+                key = variant.color.lower()
+                color_id = self.color_ids.get(key)
+                if color_id is None:
+                    color_id = self.color_ids[key] = len(self.color_labels)
+                    self.color_labels.append(variant.color)
+                    color_codes.append(variant.color_code)
+                if color_id not in local:
+                    local.append(color_id)
+                rows.append(position)
+                cols.append(size_slots[variant.size.value])
+                bits.append(local.index(color_id))
+                in_stock.append(variant.available)
+            product_colors.append(local)
+        self.colors = list(self.color_ids)
+
+        width = max((len(local) for local in product_colors), default=0)
+        self.product_colors = np.full((self.count, max(width, 1)), -1, dtype=np.int32)
+        for position, local in enumerate(product_colors):
+            self.product_colors[position, : len(local)] = local
+
+        dtype = _bitmask_dtype(max(width, 1))
+        self.offered = np.zeros((self.count, len(self.sizes)), dtype=dtype)
+        self.stock = np.zeros((self.count, len(self.sizes)), dtype=dtype)
+        if rows:
+            masks = np.left_shift(np.ones(len(bits), dtype=dtype), np.array(bits, dtype=dtype))
+            np.bitwise_or.at(self.offered, (rows, cols), masks)
+            available = np.array(in_stock, dtype=bool)
+            np.bitwise_or.at(
+                self.stock,
+                (np.array(rows)[available], np.array(cols)[available]),
+                masks[available])
+
+        # Normalized color name -> id ("nero bianco" for "Nero/Bianco")
+        self._color_names = {
+            normalize_color(label): color_id for color_id, label in enumerate(self.color_labels)
+        }
+        self.color_families = [
+            color_families(label, code) for label, code in zip(self.color_labels, color_codes)
+        ]
+        family_colors: Dict[str, List[int]] = {}
+        for color_id, families in enumerate(self.color_families):
+            for family in families:
+                family_colors.setdefault(family, []).append(color_id)
+        self.family_positions: Dict[str, np.ndarray] = {
+            family: np.flatnonzero(self._offering(color_ids))
+            for family, color_ids in family_colors.items()
+        }
+
+    def all(self) -> np.ndarray:
+        return np.ones(self.count, dtype=bool)
+
+    def _offering(self, color_ids: Sequence[int]) -> np.ndarray:
+        """Mask of the products offering any of ``color_ids``, regardless of stock."""
+        # The extra trailing False entry is what the -1 padding looks up
+        lookup = np.zeros(len(self.colors) + 1, dtype=bool)
+        lookup[list(color_ids)] = True
+        hits = lookup[self.product_colors]
+        # OR the few color columns; faster than any(axis=1) on a narrow axis
+        offered = hits[:, 0].copy()
+        for slot in range(1, hits.shape[1]):
+            offered |= hits[:, slot]
+        return offered
+
+    def color_mask(self, color: str) -> np.ndarray:
+        """Products offering ``color``, regardless of stock.
+
+        A family name ("nera", "grigi", "blu") selects the whole family from
+        the posting lists; anything else ("navy", "grigio melange") is matched
+        as a substring of the distinct color names.
+        """
+        key = normalize_color(color)
+        family = family_of_name(key)
+        if family is not None:
+            mask = np.zeros(self.count, dtype=bool)
+            positions = self.family_positions.get(family)
+            if positions is not None:
+                mask[positions] = True
+            return mask
+        return self._offering(
+            [color_id for name, color_id in self._color_names.items() if key and key in name]
+        )
+
+    def _variant_bit(
+        self, position: int, size: str, color: str
+    ) -> Optional[Tuple[int, int]]:
+        """``(size slot, color bit)`` of a variant, or None if it is not offered."""
+        color_id = self.color_ids.get(color.lower())
+        size_slot = self._size_slots.get(size)
+        if color_id is None or size_slot is None:
+            return None
+        local = self.product_colors[position].tolist()
+        if color_id not in local:
+            return None
+        bit = 1 << local.index(color_id)
+        if not int(self.offered[position, size_slot]) & bit:
+            return None
+        return size_slot, bit
+
+    def is_offered(self, position: int, size: str, color: str) -> bool:
+        return self._variant_bit(position, size, color) is not None
+
+    def is_available(self, position: int, size: str, color: str) -> bool:
+        variant = self._variant_bit(position, size, color)
+        if variant is None:
+            return False
+        size_slot, bit = variant
+        return bool(int(self.stock[position, size_slot]) & bit)
+
+    def available_sizes(self, position: int) -> List[str]:
+        """Sizes with at least one color in stock, in size order."""
+        return [self.sizes[slot] for slot in np.flatnonzero(self.stock[position])]
+
+    def available_colors(self, position: int) -> List[str]:
+        """Colors with at least one size in stock, in the product's variant order."""
+        in_stock = int(np.bitwise_or.reduce(self.stock[position]))
+        return [
+            self.color_labels[color_id]
+            for bit, color_id in enumerate(self.product_colors[position])
+            if color_id >= 0 and in_stock >> bit & 1
+        ]
+
+    def with_stock(
+        self, changes: Iterable[Tuple[int, str, str, bool]]
+    ) -> "CatalogColumns":
+        """Copy sharing every column except ``stock``, with the changes applied.
+
+        ``changes`` are ``(position, size, color, available)``; variants that
+        are not offered are ignored.
+        """
+        updated = copy.copy(self)
+        updated.stock = self.stock.copy()
+        for position, size, color, available in changes:
+            variant = self._variant_bit(position, size, color)
+            if variant is None:
+                continue
+            size_slot, bit = variant
+            current = int(updated.stock[position, size_slot])
+            updated.stock[position, size_slot] = current | bit if available else current & ~bit
+        return updated
+
+    def price_sorted(
+        self,
+        descending: bool = False,
+        mask: Optional[np.ndarray] = None,
+        price_min: Optional[float] = None,
+        price_max: Optional[float] = None) -> np.ndarray:
+        """Positions ordered by price (ties in catalog order).
+
+        The price bounds select a contiguous window of the precomputed order
+        with two binary searches; ``mask`` then filters that window, so no
+        request ever sorts.
+        """
+        if descending:
+            order, keys = self.price_order_desc, self._price_keys_desc
+            low = None if price_max is None else -price_max
+            high = None if price_min is None else -price_min
+        else:
+            order, keys = self.price_order, self._price_keys
+            low, high = price_min, price_max
+        start = 0 if low is None else int(np.searchsorted(keys, low, side="left"))
+        end = self.count if high is None else int(np.searchsorted(keys, high, side="right"))
+        window = order[start:max(start, end)]
+        if mask is not None:
+            window = window[mask[window]]
+        return window
+
+    def criterion_masks(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        size: Optional[str] = None,
+        color: Optional[str] = None,
+        price_min: Optional[float] = None,
+        price_max: Optional[float] = None,
+        on_sale: Optional[bool] = None,
+        brand: Optional[str] = None,
+        season: Optional[str] = None,
+        style: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """One boolean mask per active criterion, keyed by criterion name.
+
+        Text criteria are lower-cased substrings, matching the semantics of
+        the list-comprehension filters they replace; colors resolve to their
+        family first (see :meth:`color_mask`).
+        """
+        masks: Dict[str, np.ndarray] = {}
+
+        if category:
+            masks["category"] = _vocabulary_mask(
+                self.category, self.categories, lambda v: category in v
+            ) | _vocabulary_mask(
+                self.subcategory, self.subcategories, lambda v: category in v
+            )
+
+        if gender:
+            masks["gender"] = _vocabulary_mask(
+                self.gender, self.genders, lambda v: v in (gender, "unisex")
+            )
+
+        if size:
+            if size in self._size_slots:
+                masks["size"] = self.stock[:, self._size_slots[size]] != 0
+            else:
+                masks["size"] = np.zeros(self.count, dtype=bool)
+
+        if color:
+            masks["color"] = self.color_mask(color)
+
+        if price_min is not None or price_max is not None:
+            in_range = np.zeros(self.count, dtype=bool)
+            in_range[self.price_sorted(price_min=price_min, price_max=price_max)] = True
+            masks["price"] = in_range
+
+        if on_sale is not None:
+            masks["on_sale"] = self.on_sale == on_sale
+
+        if brand:
+            masks["brand"] = _vocabulary_mask(
+                self.brand, self.brands, lambda v: brand in v
+            )
+
+        if season:
+            masks["season"] = _vocabulary_mask(
+                self.season, self.seasons, lambda v: season in v
+            )
+
+        if style:
+            masks["style"] = _vocabulary_mask(
+                self.style, self.styles, lambda v: style in v
+            )
+
+        return masks
+
+    def mask(self, **criteria: Any) -> np.ndarray:
+        """Compile filter criteria into a single boolean mask over positions."""
+        mask = self.all()
+        for criterion in self.criterion_masks(**criteria).values():
+            mask &= criterion
+        return mask
+
+    def facet_counts(
+        self, base: Optional[np.ndarray] = None, **criteria: Any
+    ) -> Dict[str, Any]:
+        """Count products per facet value under the given criteria.
+
+        Each facet is counted with every criterion applied except its own, so
+        the client can show how many items switching that facet would yield.
+        Single-valued columns are counted with ``bincount`` over their codes
+        (one pass per facet), sizes count non-empty stock bitsets and colors
+        are counted per family over the posting lists.
+        """
+        masks = self.criterion_masks(**criteria)
+        everything = self.all() if base is None else base.copy()
+        total = everything.copy()
+        for criterion in masks.values():
+            total &= criterion
+
+        def without(facet: str) -> np.ndarray:
+            if facet not in masks:
+                return total
+            mask = everything.copy()
+            for name, criterion in masks.items():
+                if name != facet:
+                    mask &= criterion
+            return mask
+
+        def by_code(
+            codes: np.ndarray, vocabulary: List[str], mask: np.ndarray
+        ) -> Dict[str, int]:
+            counts = np.bincount(codes[mask], minlength=len(vocabulary))
+            return {value: int(n) for value, n in zip(vocabulary, counts) if n}
+
+        def by_size(mask: np.ndarray) -> Dict[str, int]:
+            counts = np.count_nonzero(self.stock[mask], axis=0)
+            return {label: int(n) for label, n in zip(self.sizes, counts) if n}
+
+        def by_color(mask: np.ndarray) -> Dict[str, int]:
+            counts = {
+                family: int(np.count_nonzero(mask[positions]))
+                for family, positions in self.family_positions.items()
+            }
+            return {family: n for family, n in counts.items() if n}
+
+        on_sale_mask = without("on_sale")
+        on_sale_count = int(np.count_nonzero(self.on_sale & on_sale_mask))
+        on_sale_counts = {
+            "true": on_sale_count,
+            "false": int(np.count_nonzero(on_sale_mask)) - on_sale_count,
+        }
+
+        return {
+            "total": int(np.count_nonzero(total)),
+            "facets": {
+                "category": by_code(self.category, self.categories, without("category")),
+                "gender": by_code(self.gender, self.genders, without("gender")),
+                "size": by_size(without("size")),
+                "color": by_color(without("color")),
+                "brand": by_code(self.brand, self.brands, without("brand")),
+                "season": by_code(self.season, self.seasons, without("season")),
+                "style": by_code(self.style, self.styles, without("style")),
+                "on_sale": {k: v for k, v in on_sale_counts.items() if v},
+                "price": {
+                    "min": float(self.price[total].min()) if total.any() else None,
+                    "max": float(self.price[total].max()) if total.any() else None,
+                },
+            },
+        }
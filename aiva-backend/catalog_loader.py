@@ -0,0 +1,127 @@
+"""Catalog source loading with a validated binary snapshot cache.
+
+The catalog lives in ``data/catalog.json``. Turning it into validated
+``Product`` models is the slow part of a cold start, so the validated models
+are pickled into a snapshot next to the source. The snapshot header carries a
+fingerprint of the source bytes plus a salt naming every other build input
+(model schema, pydantic and builder versions); when it matches, the models are
+restored without re-validation.
+
+Snapshots are only ever written by this process or by the build command below,
+so they are trusted local artifacts. The snapshot is committed next to the
+source, since serverless deployments cannot write it at runtime; rebuild it
+after editing the catalog or the ``Product`` model with::
+
+    python catalog_loader.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("AIVA.Catalog")
+
+SNAPSHOT_MAGIC = b"AIVA-CATALOG-SNAPSHOT/1\n"
+
+CatalogBuilder = Callable[[Dict[str, Any]], List[Any]]
+
+
+def catalog_fingerprint(source: bytes, salt: str = "") -> str:
+    digest = hashlib.sha256(SNAPSHOT_MAGIC)
+    digest.update(salt.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def read_snapshot(path: str, fingerprint: str) -> Optional[List[Any]]:
+    """Return the snapshot products if the file exists and matches ``fingerprint``."""
+    try:
+        with open(path, "rb") as handle:
+            if handle.readline() != SNAPSHOT_MAGIC:
+                return None
+            if handle.readline().strip().decode("ascii") != fingerprint:
+                return None
+            return pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # stale pickle from another model version, truncation...
+        logger.warning("Ignoring unreadable catalog snapshot %s: %s", path, exc)
+        return None
+
+
+def write_snapshot(path: str, fingerprint: str, products: List[Any]) -> None:
+    """Atomically write a snapshot (temp file + rename)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(SNAPSHOT_MAGIC)
+            handle.write(fingerprint.encode("ascii") + b"\n")
+            pickle.dump(products, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_catalog(
+    source_path: str,
+    snapshot_path: Optional[str],
+    build: CatalogBuilder,
+    salt: str = "") -> Tuple[List[Any], str]:
+    """Load products from a fresh snapshot, or build (and cache) them from JSON.
+
+    Returns the products with the fingerprint of the source they came from.
+    """
+    with open(source_path, "rb") as handle:
+        source = handle.read()
+    fingerprint = catalog_fingerprint(source, salt)
+
+    if snapshot_path:
+        products = read_snapshot(snapshot_path, fingerprint)
+        if products is not None:
+            logger.info("Catalog loaded from snapshot %s", snapshot_path)
+            return products, fingerprint
+
+    products = build(json.loads(source))
+
+    if snapshot_path:
+        try:
+            write_snapshot(snapshot_path, fingerprint, products)
+            logger.info("Catalog snapshot written to %s", snapshot_path)
+        except OSError as exc:  # read-only filesystems (e.g. serverless)
+            logger.info("Catalog snapshot not written (%s)", exc)
+    return products, fingerprint
+
+
+def build_snapshot(
+    source_path: str, snapshot_path: str, build: CatalogBuilder, salt: str = ""
+) -> List[Any]:
+    """Validate the JSON source and (re)write its snapshot unconditionally."""
+    with open(source_path, "rb") as handle:
+        source = handle.read()
+    products = build(json.loads(source))
+    write_snapshot(snapshot_path, catalog_fingerprint(source, salt), products)
+    return products
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    import app
+
+    built = build_snapshot(
+        app.CATALOG_PATH,
+        app.CATALOG_SNAPSHOT_PATH,
+        app.DataStore.build_catalog_products,
+        app.catalog_snapshot_salt())
+    logger.info("Built snapshot with %d products at %s", len(built), app.CATALOG_SNAPSHOT_PATH)
@@ -0,0 +1,59 @@
+"""Materialized orderings of a catalog snapshot for landing pages and listings."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from catalog_columns import CatalogColumns
+
+
+class CatalogViews:
+    """Precomputed position orders, rebuilt only with the catalog snapshot.
+
+    * ``popular``: most reviewed first (the best sellers).
+    * ``discount``: products on sale first, biggest discount first, then most
+      reviewed; the on-sale listing is the prefix ``discount[:on_sale_count]``.
+    * ``newest``: latest catalog additions first (products carry no date, so
+      load order stands in for it), also split per category.
+
+    Ties keep catalog order everywhere. Stock changes do not touch any of
+    these orders, so stock-only snapshots share the views.
+    """
+
+    def __init__(self, products: Sequence[Any], columns: CatalogColumns) -> None:
+        count = len(products)
+        positions = np.arange(count)
+        reviews = np.fromiter((p.reviews for p in products), dtype=np.int64, count=count)
+        discount = np.fromiter(
+            (p.discount_percentage if p.on_sale else 0 for p in products),
+            dtype=np.int64,
+            count=count)
+
+        self.popular = np.lexsort((positions, -reviews))
+        self.discount = np.lexsort((positions, -reviews, -discount, ~columns.on_sale))
+        self.on_sale_count = int(np.count_nonzero(columns.on_sale))
+        self.newest = positions[::-1].copy()
+        # Keyed like the canonical category criterion, with the same
+        # category-or-subcategory semantics as the filter mask
+        self.newest_by_category: Dict[str, np.ndarray] = {}
+        for category in columns.categories:
+            matches = columns.mask(category=category)
+            self.newest_by_category[category] = self.newest[matches[self.newest]]
+
+    def order(self, sort: str) -> np.ndarray:
+        return getattr(self, sort)
+
+    def materialized(
+        self, sort: str, criteria: Mapping[str, Any]
+    ) -> Optional[np.ndarray]:
+        """The complete ordered result of a query-less listing, when one of the
+        views already is that result (so serving it is a slice), else None."""
+        if not criteria:
+            return self.order(sort)
+        if sort == "discount" and dict(criteria) == {"on_sale": True}:
+            return self.discount[: self.on_sale_count]
+        if sort == "newest" and list(criteria) == ["category"]:
+            return self.newest_by_category.get(criteria["category"])
+        return None
@@ -0,0 +1,144 @@
+"""Canonical color families for catalog colors and spoken color words."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Family -> its name in every gender/number inflection (accent-free)
+FAMILY_NAMES: Dict[str, Tuple[str, ...]] = {
+    "nero": ("nero", "nera", "neri", "nere", "black"),
+    "bianco": ("bianco", "bianca", "bianchi", "bianche", "white"),
+    "grigio": ("grigio", "grigia", "grigi", "grigie", "grey", "gray"),
+    "blu": ("blu", "blue"),
+    "azzurro": ("azzurro", "azzurra", "azzurri", "azzurre"),
+    "rosso": ("rosso", "rossa", "rossi", "rosse", "red"),
+    "rosa": ("rosa", "pink"),
+    "verde": ("verde", "verdi", "green"),
+    "beige": ("beige",),
+    "marrone": ("marrone", "marroni", "brown"),
+    "giallo": ("giallo", "gialla", "gialli", "gialle", "yellow"),
+    "arancione": ("arancione", "arancioni", "arancio", "orange"),
+    "viola": ("viola", "purple"),
+}
+
+# Family -> shade words that imply it. A word listed under several families
+# is ambiguous; the variant's hex code decides between them.
+FAMILY_SHADES: Dict[str, Tuple[str, ...]] = {
+    "bianco": ("avorio", "panna", "crema", "ottico"),
+    "grigio": ("antracite", "melange", "perla", "fumo"),
+    "blu": ("navy", "notte", "cobalto", "indaco", "denim"),
+    "azzurro": ("celeste", "celesti", "denim"),
+    "rosso": ("bordeaux", "borgogna", "ciliegia"),
+    "rosa": ("cipria", "fucsia"),
+    "verde": ("militare", "oliva", "salvia", "smeraldo"),
+    "beige": ("cammello", "kaki", "sabbia", "naturale", "nude", "tortora", "panna", "crema"),
+    "marrone": ("cognac", "cuoio", "cioccolato", "tabacco"),
+    "giallo": ("senape", "ocra"),
+    "arancione": ("corallo",),
+    "viola": ("lilla", "lavanda", "prugna"),
+}
+
+# Reference swatch per family, used to break ties and classify unknown names
+FAMILY_SWATCHES: Dict[str, Tuple[int, int, int]] = {
+    "nero": (0x00, 0x00, 0x00),
+    "bianco": (0xFF, 0xFF, 0xFF),
+    "grigio": (0x80, 0x80, 0x80),
+    "blu": (0x1E, 0x3A, 0x8A),
+    "azzurro": (0x87, 0xCE, 0xEB),
+    "rosso": (0xB2, 0x22, 0x22),
+    "rosa": (0xF4, 0xA6, 0xB8),
+    "verde": (0x4B, 0x7F, 0x3A),
+    "beige": (0xD8, 0xC3, 0xA5),
+    "marrone": (0x8B, 0x45, 0x13),
+    "giallo": (0xF2, 0xC2, 0x00),
+    "arancione": (0xFF, 0x8C, 0x00),
+    "viola": (0x7D, 0x3C, 0x98),
+}
+
+_NAME_FAMILY: Dict[str, str] = {
+    word: family for family, words in FAMILY_NAMES.items() for word in words
+}
+_WORD_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    word: (family,) for word, family in _NAME_FAMILY.items()
+}
+for _family, _words in FAMILY_SHADES.items():
+    for _word in _words:
+        _WORD_FAMILIES[_word] = _WORD_FAMILIES.get(_word, ()) + (_family,)
+
+_HEX_CODE = re.compile(r"#?([0-9a-fA-F]{6})")
+
+
+@lru_cache(maxsize=4096)
+def normalize_color(value: Optional[str]) -> str:
+    """Lower-case, strip accents, turn punctuation ("Nero/Bianco") into spaces."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    ascii_only = decomposed.encode("ascii", "ignore").decode("ascii")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", ascii_only).split())
+
+
+def _rgb(hex_code: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    match = _HEX_CODE.fullmatch((hex_code or "").strip())
+    if match is None:
+        return None
+    value = int(match.group(1), 16)
+    return value >> 16, value >> 8 & 0xFF, value & 0xFF
+
+
+def _nearest(rgb: Tuple[int, int, int], families: Tuple[str, ...]) -> str:
+    return min(
+        families,
+        key=lambda family: sum((a - b) ** 2 for a, b in zip(rgb, FAMILY_SWATCHES[family])))
+
+
+def _component_family(
+    component: str, rgb: Optional[Tuple[int, int, int]]
+) -> Optional[str]:
+    """Family of one color component such as "grigio melange" or "denim chiaro"."""
+    candidates: Tuple[str, ...] = ()
+    for word in component.split():
+        for family in _WORD_FAMILIES.get(word, ()):
+            if family not in candidates:
+                candidates += (family,)
+    if len(candidates) == 1:
+        return candidates[0]
+    if rgb is None:
+        return candidates[0] if candidates else None
+    return _nearest(rgb, candidates or tuple(FAMILY_SWATCHES))
+
+
+@lru_cache(maxsize=4096)
+def color_families(name: str, hex_code: Optional[str] = None) -> Tuple[str, ...]:
+    """Families of a catalog color, primary first ("Nero/Bianco" -> nero, bianco).
+
+    Each "/"-separated component is classified by its words; when they name
+    several families (or none) the variant's ``hex_code`` picks the nearest
+    swatch. The hex code describes the primary component, so secondary ones
+    fall back to their first family.
+    """
+    rgb = _rgb(hex_code)
+    families: Tuple[str, ...] = ()
+    for index, component in enumerate((name or "").split("/")):
+        family = _component_family(normalize_color(component), rgb if index == 0 else None)
+        if family is not None and family not in families:
+            families += (family,)
+    return families
+
+
+def family_of_name(text: Optional[str]) -> Optional[str]:
+    """Family whose name ``text`` is, in any inflection ("nere", "grigi")."""
+    return _NAME_FAMILY.get(normalize_color(text))
+
+
+@lru_cache(maxsize=4096)
+def query_family(text: Optional[str]) -> Optional[str]:
+    """Family implied by a spoken or typed color ("nera", "blu navy", "antracite")."""
+    for word in normalize_color(text).split():
+        families = _WORD_FAMILIES.get(word)
+        if families:
+            return families[0]
+    return None
@@ -0,0 +1,183 @@
+"""Negotiated gzip/brotli response compression, per request or ahead of time."""
+
+from __future__ import annotations
+
+import os
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # pragma: no cover - optional dependency handling
+    import brotli  # type: ignore
+except Exception:  # pragma: no cover - fallback when dependency missing
+    brotli = None  # type: ignore
+
+# Smaller bodies are sent as they are: the framing overhead eats the savings
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Supported content codings, most preferred first
+AVAILABLE_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Per-request compression favours speed; precompressed payloads are built once,
+# so they take the best ratio
+_DYNAMIC_LEVELS: Dict[str, int] = {"br": 5, "gzip": 6}
+_STATIC_LEVELS: Dict[str, int] = {"br": 11, "gzip": 9}
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best available coding allowed by an Accept-Encoding header, if any.
+
+    Higher q-values win; ties go to the server preference (brotli first).
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip()] = weight
+    best: Optional[str] = None
+    best_weight = 0.0
+    for coding in AVAILABLE_ENCODINGS:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def _compressor(encoding: str, static: bool) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """``(compress, finish)`` callables of an incremental compressor."""
+    levels = _STATIC_LEVELS if static else _DYNAMIC_LEVELS
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=levels["br"])
+        return compressor.process, compressor.finish
+    # wbits=31: gzip container with a zero mtime, so output is deterministic
+    compressor = zlib.compressobj(levels["gzip"], zlib.DEFLATED, 31)
+    return compressor.compress, compressor.flush
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """``body`` in the given content coding (``static``: best ratio, slower)."""
+    process, finish = _compressor(encoding, static)
+    return process(body) + finish()
+
+
+def coded_etag(etag: str, encoding: Optional[str]) -> str:
+    """ETag of the ``encoding``-coded representation of a resource.
+
+    Strong validators must differ across content codings (RFC 9110), so the
+    coding is appended inside the quotes: ``"abc"`` -> ``"abc-gzip"``. Weak
+    validators are shared by all codings and returned unchanged.
+    """
+    if encoding is None or etag.startswith("W/"):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Compresses compressible responses of at least ``minimum_size`` bytes.
+
+    Responses that already carry a Content-Encoding (precompressed payloads)
+    pass through untouched; streamed bodies are compressed chunk by chunk.
+    Strong ETags of compressed responses get the coding suffix.
+    Every compressible response gets ``Vary: Accept-Encoding`` so shared
+    caches keep one copy per coding.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        await self.app(scope, receive, _CompressingSend(send, encoding, self.minimum_size))
+
+
+class _CompressingSend:
+    """``send`` wrapper that holds the response start until the first body chunk."""
+
+    def __init__(self, send: Send, encoding: Optional[str], minimum_size: int) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.process: Optional[Callable[[bytes], bytes]] = None
+        self.finish: Optional[Callable[[], bytes]] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough or message["type"] not in ("http.response.start", "http.response.body"):
+            await self.send(message)
+            return
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if self.process is not None:
+            await self._send_chunk(message)
+            return
+        await self._first_chunk(message)
+
+    async def _first_chunk(self, message: Message) -> None:
+        start = self.start
+        headers = MutableHeaders(raw=start["headers"])
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if not is_compressible(headers.get("content-type")):
+            self.passthrough = True
+            await self.send(start)
+            await self.send(message)
+            return
+        if "accept-encoding" not in headers.get("vary", "").lower():
+            headers.add_vary_header("Accept-Encoding")
+        if (
+            self.encoding is None
+            or "content-encoding" in headers
+            or (not more_body and len(body) < self.minimum_size)
+        ):
+            self.passthrough = True
+            await self.send(start)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        if "etag" in headers:
+            headers["ETag"] = coded_etag(headers["etag"], self.encoding)
+        if not more_body:
+            self.passthrough = True
+            body = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(body))
+            await self.send(start)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+
+        # Streamed body: the final length is unknown
+        del headers["Content-Length"]
+        self.process, self.finish = _compressor(self.encoding, static=False)
+        await self.send(start)
+        await self._send_chunk(message)
+
+    async def _send_chunk(self, message: Message) -> None:
+        more_body = message.get("more_body", False)
+        body = self.process(message.get("body", b""))
+        if not more_body:
+            body += self.finish()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
@@ -0,0 +1,201 @@
+"""Pre-serialized (and precompressed) JSON responses with strong ETags and
+conditional GET support."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from compression import (
+    AVAILABLE_ENCODINGS,
+    COMPRESSION_MIN_SIZE,
+    coded_etag,
+    compress,
+    negotiate)
+
+try:  # pragma: no cover - optional dependency handling
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fallback when dependency missing
+    orjson = None  # type: ignore
+
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+else:  # pragma: no cover
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+
+# Informational payloads: browsers keep them 5 minutes, shared caches (CDN) 1 hour
+DEFAULT_CACHE_CONTROL = "public, max-age=300, s-maxage=3600"
+
+
+def json_bytes(payload: Any) -> bytes:
+    """Compact UTF-8 JSON, the same document FastAPI's JSON responses produce."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":")).encode("utf-8")
+
+
+def json_array(items: Iterable[bytes]) -> bytes:
+    """Splice already serialized JSON values into one array."""
+    return b"[" + b",".join(items) + b"]"
+
+
+def json_response(
+    body: bytes,
+    headers: Optional[Dict[str, str]] = None,
+    encoding: Optional[str] = None) -> Response:
+    """JSON response of ``body``, already in the content coding ``encoding`` if
+    given (a strong ETag in ``headers`` then gets the coding suffix)."""
+    if encoding is not None:
+        headers = {**(headers or {}), "Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+        if "ETag" in headers:
+            headers["ETag"] = coded_etag(headers["ETag"], encoding)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def accepted_encoding(request: Optional[Request]) -> Optional[str]:
+    if request is None:
+        return None
+    return negotiate(request.headers.get("accept-encoding"))
+
+
+def strong_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def catalog_etag(request: Request, revision: str) -> str:
+    """Strong ETag of a catalog-derived response: the catalog revision plus
+    the path and (order-insensitive) query parameters that produced it."""
+    key = (request.url.path, sorted(request.query_params.multi_items()))
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+    return f'"{revision}-{digest}"'
+
+
+def matched_etag(request: Request, etag: str) -> Optional[str]:
+    """The form of ``etag`` (identity or any content coding) that the
+    request's If-None-Match names, if any."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    if header.strip() == "*":
+        return etag
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    candidates: Set[str] = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    for encoding in (None, *AVAILABLE_ENCODINGS):
+        tag = coded_etag(etag, encoding)
+        if tag in candidates:
+            return tag
+    return None
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names ``etag``."""
+    return matched_etag(request, etag) is not None
+
+
+def not_modified(request: Request, headers: Dict[str, str]) -> Response:
+    """304 for a request whose If-None-Match matched ``headers["ETag"]``,
+    echoing the representation (content coding) the client holds."""
+    headers = {**headers, "Vary": "Accept-Encoding"}
+    headers["ETag"] = matched_etag(request, headers["ETag"]) or headers["ETag"]
+    return Response(status_code=304, headers=headers)
+
+
+class PreparedJSON:
+    """A JSON payload serialized once, served from memory.
+
+    Build one whenever the source data changes; each hit then costs a header
+    comparison and either a 304 or a copy-free write of the stored bytes, in
+    the best content coding the client accepts (compressed once, up front).
+    """
+
+    __slots__ = ("payload", "body", "compressed", "etag", "cache_control")
+
+    def __init__(self, payload: Any, cache_control: str = DEFAULT_CACHE_CONTROL) -> None:
+        self.payload = payload
+        self.body = json_bytes(payload)
+        self.compressed: Dict[str, bytes] = (
+            {encoding: compress(self.body, encoding, static=True) for encoding in AVAILABLE_ENCODINGS}
+            if len(self.body) >= COMPRESSION_MIN_SIZE
+            else {}
+        )
+        self.etag = strong_etag(self.body)
+        self.cache_control = cache_control
+
+    def headers(self) -> Dict[str, str]:
+        return {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+    def response(self, request: Optional[Request] = None) -> Response:
+        if request is not None and etag_matches(request, self.etag):
+            return not_modified(request, self.headers())
+        encoding = accepted_encoding(request)
+        if encoding in self.compressed:
+            return json_response(self.compressed[encoding], self.headers(), encoding)
+        return json_response(self.body, self.headers())
+
+
+class SerializedModels:
+    """Per-position JSON bytes of immutable pydantic models, filled on first use.
+
+    Belongs to one catalog snapshot: its models never change, so each one is
+    serialized at most once per snapshot (a race only serializes it twice),
+    and compressed at most once per content coding when served on its own.
+    ``include`` restricts the payloads to a field projection.
+    """
+
+    __slots__ = ("_models", "include", "_payloads", "_compressed")
+
+    def __init__(
+        self, models: Sequence[BaseModel], include: Optional[AbstractSet[str]] = None
+    ) -> None:
+        self._models = models
+        self.include = include
+        self._payloads: List[Optional[bytes]] = [None] * len(models)
+        self._compressed: Dict[str, List[Optional[bytes]]] = {
+            encoding: [None] * len(models) for encoding in AVAILABLE_ENCODINGS
+        }
+
+    def __getitem__(self, position: int) -> bytes:
+        payload = self._payloads[position]
+        if payload is None:
+            model = self._models[position]
+            payload = model.model_dump_json(include=self.include).encode("utf-8")
+            self._payloads[position] = payload
+        return payload
+
+    def encoded(self, position: int, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """``(body, coding)`` of the payload at ``position``: precompressed in
+        ``encoding`` when one is requested and the payload is large enough."""
+        payload = self[position]
+        if encoding not in self._compressed or len(payload) < COMPRESSION_MIN_SIZE:
+            return payload, None
+        variants = self._compressed[encoding]
+        body = variants[position]
+        if body is None:
+            body = variants[position] = compress(payload, encoding, static=True)
+        return body, encoding
+
+    def replaced(
+        self, models: Sequence[BaseModel], positions: Iterable[int]
+    ) -> "SerializedModels":
+        """Copy for ``models`` where only ``positions`` changed."""
+        updated = SerializedModels.__new__(SerializedModels)
+        updated._models = models
+        updated.include = self.include
+        updated._payloads = list(self._payloads)
+        updated._compressed = {
+            encoding: list(variants) for encoding, variants in self._compressed.items()
+        }
+        for position in positions:
+            updated._payloads[position] = None
+            for variants in updated._compressed.values():
+                variants[position] = None
+        return updated
@@ -0,0 +1,64 @@
+"""Opaque cursors, bound to a catalog revision, for paginated product listings."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Hashable
+
+
+class CursorError(ValueError):
+    """The cursor is malformed or belongs to a different query."""
+
+
+class StaleCursorError(CursorError):
+    """The cursor was issued for another catalog revision."""
+
+
+def query_fingerprint(query_key: Hashable) -> str:
+    """Short digest identifying a normalized query + filters combination."""
+    return hashlib.sha256(repr(query_key).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class PageCursor:
+    """Position of the next page within one ordered result list.
+
+    Result lists are ordered by a stable key (relevance, then catalog
+    position), so an offset is exact as long as the catalog revision it was
+    issued for is still current. Revisions identify catalog contents across
+    restarts (see ``CatalogSnapshot.build_revision``), so a cursor from
+    another catalog, or from before a restart that changed it, is rejected
+    instead of silently skipping or repeating items.
+    """
+
+    revision: str
+    query: str
+    offset: int
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {"r": self.revision, "q": self.query, "o": self.offset},
+            separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            cursor = cls(str(payload["r"]), str(payload["q"]), int(payload["o"]))
+        except (ValueError, TypeError, KeyError, UnicodeError) as exc:
+            raise CursorError("Invalid cursor") from exc
+        if cursor.offset < 0:
+            raise CursorError("Invalid cursor")
+        return cursor
+
+    def check(self, revision: str, query: str) -> None:
+        """Raise unless the cursor belongs to ``query`` at catalog ``revision``."""
+        if self.query != query:
+            raise CursorError("Cursor does not match the current query")
+        if self.revision != revision:
+            raise StaleCursorError("Catalog changed since the cursor was issued")
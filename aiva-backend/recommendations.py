@@ -0,0 +1,136 @@
+"""Precomputed complementary-outfit and similar-product lists per catalog position."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from catalog_columns import CatalogColumns
+
+# Category -> complementary categories and how many picks each contributes,
+# in the order they are suggested
+COMPLEMENTARY_CATEGORIES: Mapping[str, Tuple[Tuple[str, int], ...]] = {
+    "t-shirt": (("pantaloni", 1), ("scarpe", 1)),
+    "camicia": (("pantaloni", 1), ("scarpe", 1)),
+    "maglione": (("pantaloni", 1), ("scarpe", 1)),
+    "felpa": (("pantaloni", 1), ("scarpe", 1)),
+    "giacca": (("maglione", 1), ("pantaloni", 1)),
+    "pantaloni": (("camicia", 1), ("scarpe", 1)),
+    "shorts": (("t-shirt", 1), ("scarpe", 1)),
+    "gonna": (("camicia", 1), ("scarpe", 1)),
+    "vestito": (("scarpe", 1), ("accessori", 1)),
+    "scarpe": (("accessori", 2),),
+}
+
+# Similar products kept per product; requests for more are served up to this
+RECOMMENDATION_DEPTH = 20
+
+
+def _ranked(candidates: np.ndarray, tiers: Sequence[np.ndarray], depth: int) -> Tuple[int, ...]:
+    """First ``depth`` candidates ordered by tier (all true first), then position.
+
+    ``tiers`` are boolean arrays aligned with ``candidates``, most important
+    first; each combination forms a bucket and buckets are taken in order, so
+    only the few winners are ever materialized.
+    """
+    picks: List[int] = []
+    for bucket in range(2 ** len(tiers)):
+        selected = np.ones(len(candidates), dtype=bool)
+        for bit, tier in enumerate(tiers):
+            wanted = not bucket >> (len(tiers) - 1 - bit) & 1
+            selected &= tier if wanted else ~tier
+        picks.extend(candidates[selected][: depth - len(picks)].tolist())
+        if len(picks) >= depth:
+            break
+    return tuple(picks)
+
+
+class RecommendationTable:
+    """Ranked complementary and similar products for every catalog position.
+
+    Built once per catalog snapshot from the filter columns. Products sharing
+    the attributes the ranking looks at share the same tuples, so the table
+    costs two references per product and a lookup is O(limit).
+
+    * complementary: for each category in :data:`COMPLEMENTARY_CATEGORIES`,
+      the best picks that fit the product's gender (its own or unisex; only
+      unisex for a unisex product), then share its style, then come first
+      in the catalog.
+    * similar: same category and gender, same subcategory and style first.
+    """
+
+    def __init__(self, columns: CatalogColumns, depth: int = RECOMMENDATION_DEPTH) -> None:
+        self.depth = depth
+        category_ids = {name: code for code, name in enumerate(columns.categories)}
+        unisex = columns.genders.index("unisex") if "unisex" in columns.genders else -1
+        by_category: Dict[int, np.ndarray] = {
+            code: np.flatnonzero(columns.category == code)
+            for code in range(len(columns.categories))
+        }
+
+        complementary_cache: Dict[Tuple[int, int, int], Tuple[int, ...]] = {}
+        similar_cache: Dict[Tuple[int, int, int, int], Tuple[int, ...]] = {}
+        self._complementary: List[Tuple[int, ...]] = []
+        self._similar: List[Tuple[int, ...]] = []
+
+        rows = zip(
+            columns.category.tolist(),
+            columns.gender.tolist(),
+            columns.subcategory.tolist(),
+            columns.style.tolist())
+        for category, gender, subcategory, style in rows:
+            key = (category, gender, style)
+            complementary = complementary_cache.get(key)
+            if complementary is None:
+                picks: List[int] = []
+                targets = COMPLEMENTARY_CATEGORIES.get(columns.categories[category], ())
+                for target, count in targets:
+                    code = category_ids.get(target)
+                    if code is None:
+                        continue
+                    candidates = by_category[code]
+                    genders = columns.gender[candidates]
+                    # A unisex product suits anyone, but gendered picks would
+                    # steer it towards one wearer: unisex candidates go first
+                    fits = genders == unisex
+                    if gender != unisex:
+                        fits |= genders == gender
+                    picks.extend(
+                        _ranked(candidates, (fits, columns.style[candidates] == style), count)
+                    )
+                complementary = complementary_cache[key] = tuple(picks)
+            self._complementary.append(complementary)
+
+            similar_key = (category, gender, subcategory, style)
+            similar = similar_cache.get(similar_key)
+            if similar is None:
+                candidates = by_category[category]
+                candidates = candidates[columns.gender[candidates] == gender]
+                # One extra pick, since the product itself is among them
+                similar = similar_cache[similar_key] = _ranked(
+                    candidates,
+                    (
+                        columns.subcategory[candidates] == subcategory,
+                        columns.style[candidates] == style,
+                    ),
+                    depth + 1)
+            self._similar.append(similar)
+
+    def complementary(self, position: int) -> Tuple[int, ...]:
+        return self._complementary[position]
+
+    def similar(self, position: int, limit: int) -> List[int]:
+        picks: List[int] = []
+        for candidate in self._similar[position]:
+            if len(picks) >= limit:
+                break
+            if candidate != position:
+                picks.append(candidate)
+        return picks
+
+    def for_product(self, position: int, limit: int) -> List[int]:
+        """Complementary picks first, topped up with similar products."""
+        picks = list(self._complementary[position][:limit])
+        picks.extend(self.similar(position, limit - len(picks)))
+        return picks
@@ -0,0 +1,99 @@
+"""Bounded LRU/TTL cache for product search results."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def result_size(value: Any) -> int:
+    """Approximate bytes held by a cached result: numpy arrays count their
+    buffer, tuples their items, anything else its shallow size."""
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(result_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class QueryResultCache:
+    """LRU cache with a time-to-live, a byte budget and hit/miss counters.
+
+    Keys are expected to embed the catalog version, so entries computed
+    against an older catalog can never be served; :meth:`clear` drops them
+    eagerly when the version changes. Least recently used entries are
+    evicted once there are more than ``maxsize`` of them or they hold more
+    than ``maxbytes`` (see :func:`result_size`); a result larger than the
+    whole budget is not cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl: float = 300.0,
+        maxbytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = max(0, maxsize)
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value, _ = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self._discard(key)
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = result_size(value)
+        if not self.maxsize or (self.maxbytes is not None and size > self.maxbytes):
+            return
+        self._discard(key)
+        self._entries[key] = (self._clock() + self.ttl, value, size)
+        self.nbytes += size
+        while len(self._entries) > self.maxsize or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        ):
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "bytes": self.nbytes,
+            "maxbytes": self.maxbytes,
+            "ttl_seconds": self.ttl,
+        }
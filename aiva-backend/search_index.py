@@ -0,0 +1,297 @@
+"""Inverted indexes backing the catalog text search and fuzzy name lookups."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+_GRAM_SIZE = 3
+
+# Italian articles, prepositions and conjunctions: they occur in nearly every
+# description, so as query terms they only add cost, never selectivity
+STOPWORDS: FrozenSet[str] = frozenset(
+    """a ad agli ai al alla alle allo col con da dai dal dalla dalle dallo degli dei del
+    della delle dello di e ed fra gli i il in la le lo negli nei nel nella nelle nello o
+    per sui sul sulla sulle su tra un una uno""".split()
+)
+
+
+def _grams(token: str) -> Set[str]:
+    return {token[i : i + _GRAM_SIZE] for i in range(len(token) - _GRAM_SIZE + 1)}
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """Lower-case, strip accents and punctuation, collapse whitespace.
+
+    Mirrors the key normalization of the frontend's visible products map.
+    """
+    decomposed = unicodedata.normalize("NFKD", (text or "").lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^a-z0-9\s]", "", stripped).split())
+
+
+def _name_grams(name: str) -> FrozenSet[str]:
+    """Trigrams of every word padded with spaces, so boundaries count too."""
+    return frozenset(gram for word in name.split() for gram in _grams(f" {word} "))
+
+
+@dataclass(frozen=True, slots=True)
+class SearchDocument:
+    """Precomputed, immutable search view of a single product.
+
+    ``fields`` holds the tokens of each weighted field (see
+    :attr:`SearchIndex.FIELD_WEIGHTS`).
+    """
+
+    fields: Mapping[str, Tuple[str, ...]]
+
+
+class SearchIndex:
+    """Field-weighted BM25 (BM25F) index over catalog positions.
+
+    Query terms are matched as substrings of indexed tokens, like the linear
+    scan this index replaced; a trigram map of the vocabulary narrows a term
+    down to the few tokens that can contain it, so lookups never touch the
+    products themselves. Exact token hits count fully, substring hits are
+    discounted by ``PARTIAL_MATCH_WEIGHT``. Terms shorter than a trigram
+    only match whole tokens, stopwords are ignored, and a term expands to at
+    most ``MAX_EXPANSIONS`` partial tokens (the rarest ones), so a query costs
+    the same whatever the catalog size.
+
+    ``raw_tags`` holds the tags as written, before synonym folding, so terms
+    such as "blu" still find "blusa"; like the old scan, a hit there alone
+    counts less than one in the normalized text.
+    """
+
+    FIELD_WEIGHTS: Dict[str, float] = {
+        "name": 3.0,
+        "tags": 2.0,
+        "description": 1.0,
+        "raw_tags": 0.5,
+    }
+    K1 = 1.2
+    B = 0.75
+    PARTIAL_MATCH_WEIGHT = 0.5
+    MAX_EXPANSIONS = 32
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, Dict[int, int]]] = {
+            field: defaultdict(dict) for field in self.FIELD_WEIGHTS
+        }
+        self._lengths: Dict[str, Dict[int, int]] = {
+            field: {} for field in self.FIELD_WEIGHTS
+        }
+        self._total_lengths: Dict[str, int] = {field: 0 for field in self.FIELD_WEIGHTS}
+        self._positions: Set[int] = set()
+        # token -> number of (field, position) postings referencing it
+        self._vocabulary: Dict[str, int] = {}
+        self._vocabulary_grams: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def add(self, position: int, document: SearchDocument) -> None:
+        self._positions.add(position)
+        for field in self.FIELD_WEIGHTS:
+            tokens = document.fields.get(field, ())
+            self._lengths[field][position] = len(tokens)
+            self._total_lengths[field] += len(tokens)
+            for token, count in Counter(tokens).items():
+                self._postings[field][token][position] = count
+                refs = self._vocabulary.get(token, 0)
+                if not refs:
+                    for gram in _grams(token):
+                        self._vocabulary_grams[gram].add(token)
+                self._vocabulary[token] = refs + 1
+
+    def remove(self, position: int, document: SearchDocument) -> None:
+        if position not in self._positions:
+            return
+        self._positions.discard(position)
+        for field in self.FIELD_WEIGHTS:
+            self._total_lengths[field] -= self._lengths[field].pop(position, 0)
+            for token in set(document.fields.get(field, ())):
+                postings = self._postings[field].get(token)
+                if not postings or postings.pop(position, None) is None:
+                    continue
+                if not postings:
+                    del self._postings[field][token]
+                refs = self._vocabulary[token] - 1
+                if refs:
+                    self._vocabulary[token] = refs
+                    continue
+                del self._vocabulary[token]
+                for gram in _grams(token):
+                    vocabulary = self._vocabulary_grams.get(gram)
+                    if vocabulary is not None:
+                        vocabulary.discard(token)
+                        if not vocabulary:
+                            del self._vocabulary_grams[gram]
+
+    def matching_tokens(self, term: str) -> List[str]:
+        """Indexed tokens that contain ``term``: the token equal to it, if
+        any, plus the ``MAX_EXPANSIONS`` rarest longer ones."""
+        if len(term) < _GRAM_SIZE:
+            return [term] if term in self._vocabulary else []
+
+        grams = sorted(
+            _grams(term), key=lambda g: len(self._vocabulary_grams.get(g, ()))
+        )
+        candidates = set(self._vocabulary_grams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._vocabulary_grams.get(gram, set())
+        partial = [token for token in candidates if term in token and token != term]
+        if len(partial) > self.MAX_EXPANSIONS:
+            partial = heapq.nsmallest(
+                self.MAX_EXPANSIONS, partial, key=lambda token: (self._vocabulary[token], token)
+            )
+        return [term, *partial] if term in candidates else partial
+
+    def score(self, terms: Iterable[str]) -> Dict[int, float]:
+        """BM25F score of every position matching at least one non-stopword term."""
+        scores: Dict[int, float] = defaultdict(float)
+        total = len(self._positions)
+        if not total:
+            return scores
+
+        for term in terms:
+            if term in STOPWORDS:
+                continue
+            expansions = [
+                (token, 1.0 if token == term else self.PARTIAL_MATCH_WEIGHT)
+                for token in self.matching_tokens(term)
+            ]
+            if not expansions:
+                continue
+
+            weighted_tf: Dict[int, float] = defaultdict(float)
+            for field, field_weight in self.FIELD_WEIGHTS.items():
+                postings = self._postings[field]
+                lengths = self._lengths[field]
+                average = (self._total_lengths[field] / total) or 1.0
+                for token, match_weight in expansions:
+                    for position, count in postings.get(token, {}).items():
+                        norm = 1 - self.B + self.B * lengths[position] / average
+                        weighted_tf[position] += field_weight * match_weight * count / norm
+
+            frequency = len(weighted_tf)
+            idf = math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for position, tf in weighted_tf.items():
+                scores[position] += idf * tf / (self.K1 + tf)
+        return scores
+
+    @staticmethod
+    def rank(
+        scores: Mapping[int, float],
+        limit: Optional[int] = None,
+        accept: Optional[Sequence[bool]] = None) -> List[int]:
+        """Order positions by score (ties in catalog order).
+
+        With ``limit`` the top ``limit`` positions are selected through a
+        heap of that size, so the candidates are neither sorted nor copied;
+        result pages pass the window they serve. ``accept`` is an optional
+        boolean mask (e.g. compiled filters), checked while streaming the
+        candidates into the heap.
+        """
+        candidates: Iterable[int] = scores
+        if accept is not None:
+            candidates = (position for position in scores if accept[position])
+
+        def key(position: int) -> Tuple[float, int]:
+            return scores[position], -position
+
+        if limit is None:
+            return sorted(candidates, key=key, reverse=True)
+        return heapq.nlargest(max(limit, 0), candidates, key=key)
+
+    def search(
+        self,
+        terms: Iterable[str],
+        limit: Optional[int] = None,
+        accept: Optional[Sequence[bool]] = None) -> List[int]:
+        """Return matching positions, best first."""
+        return self.rank(self.score(terms), limit=limit, accept=accept)
+
+
+class NameIndex:
+    """Trigram index over product names for typo-tolerant lookups.
+
+    Candidates are gathered from the postings of the query's trigrams only,
+    so a lookup never scans the whole catalog. They are ranked by how much of
+    the query's trigrams they cover (spoken requests are often a shortened
+    name), then by the Dice coefficient so tighter names win ties; trigram
+    overlap tolerates the dropped or swapped letters typical of
+    speech-to-text.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._grams: Dict[int, FrozenSet[str]] = {}
+        self._exact: Dict[str, Set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def add(self, position: int, name: str) -> None:
+        normalized = normalize_name(name)
+        grams = _name_grams(normalized)
+        self._grams[position] = grams
+        self._exact[normalized].add(position)
+        for gram in grams:
+            self._postings[gram].add(position)
+
+    def remove(self, position: int, name: str) -> None:
+        grams = self._grams.pop(position, None)
+        if grams is None:
+            return
+        normalized = normalize_name(name)
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            exact.discard(position)
+            if not exact:
+                del self._exact[normalized]
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(position)
+                if not postings:
+                    del self._postings[gram]
+
+    def match(
+        self,
+        name: str,
+        limit: int = 5,
+        cutoff: float = 0.5) -> List[Tuple[int, float]]:
+        """Best ``(position, coverage)`` pairs, most similar first.
+
+        An exact (normalized) name short-circuits with 1.0; other candidates
+        need to cover at least ``cutoff`` of the query's trigrams.
+        """
+        normalized = normalize_name(name)
+        exact = self._exact.get(normalized)
+        if exact:
+            return [(position, 1.0) for position in sorted(exact)[: max(limit, 0)]]
+
+        query = _name_grams(normalized)
+        if not query:
+            return []
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in query:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        def key(position: int) -> Tuple[float, float, int]:
+            count = shared[position]
+            dice = 2.0 * count / (len(query) + len(self._grams[position]))
+            return count / len(query), dice, -position
+
+        candidates = (p for p, count in shared.items() if count / len(query) >= cutoff)
+        best = heapq.nlargest(max(limit, 0), candidates, key=key)
+        return [(position, shared[position] / len(query)) for position in best]
@@ -103,6 +103,116 @@ async def test_fashion_catalog(client: httpx.AsyncClient) -> bool:
     
     return True
 
+async def test_pagination(client: httpx.AsyncClient) -> bool:
+    """Test cursor pagination of the product list"""
+    print(f"\n{Colors.BLUE}Testing Paginazione:{Colors.RESET}")
+    
+    seen = []
+    cursor = None
+    total = None
+    while True:
+        params = {"limit": 8}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/products", params=params)
+        if response.status_code != 200:
+            print(f"{Colors.RED}✗{Colors.RESET} Pagina non disponibile ({response.status_code})")
+            return False
+        total = int(response.headers.get("X-Total-Count", 0))
+        seen.extend(product["id"] for product in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    
+    if len(seen) != total or len(set(seen)) != total:
+        print(f"{Colors.RED}✗{Colors.RESET} Pagine incoerenti: {len(seen)} prodotti, totale {total}")
+        return False
+    
+    print(f"{Colors.GREEN}✓{Colors.RESET} {total} prodotti in pagine da 8, nessun duplicato")
+    return True
+
+async def test_facets(client: httpx.AsyncClient) -> bool:
+    """Test facet counts against the product list totals"""
+    print(f"\n{Colors.BLUE}Testing Faccette:{Colors.RESET}")
+    
+    for params in ({}, {"gender": "donna"}, {"q": "felpa"}, {"on_sale": "true"}):
+        response = await client.get("/api/products/facets", params=params)
+        listing = await client.get("/api/products", params={**params, "limit": 1})
+        if response.status_code != 200 or listing.status_code != 200:
+            print(f"{Colors.RED}✗{Colors.RESET} {params} → errore {response.status_code}")
+            return False
+        facets = response.json()
+        total = int(listing.headers.get("X-Total-Count", -1))
+        by_category = sum(facets["facets"]["category"].values())
+        if facets["total"] != total or by_category != total:
+            print(f"{Colors.RED}✗{Colors.RESET} {params} → totale {facets['total']}, categorie {by_category}, lista {total}")
+            return False
+        print(f"{Colors.GREEN}✓{Colors.RESET} {params or 'catalogo'} → {total} prodotti, somma categorie coerente")
+    
+    return True
+
+async def test_conditional_get(client: httpx.AsyncClient) -> bool:
+    """Test If-None-Match revalidation (304) of catalog and static responses"""
+    print(f"\n{Colors.BLUE}Testing Cache Condizionale:{Colors.RESET}")
+    
+    listing = await client.get("/api/products", params={"limit": 1})
+    product_id = listing.json()[0]["id"]
+    for path, params in (
+        ("/api/products", {"limit": 5}),
+        (f"/api/products/{product_id}", {}),
+        ("/api/promotions", {}),
+    ):
+        first = await client.get(path, params=params)
+        etag = first.headers.get("ETag")
+        if first.status_code != 200 or not etag:
+            print(f"{Colors.RED}✗{Colors.RESET} {path} → nessun ETag ({first.status_code})")
+            return False
+        cached = await client.get(path, params=params, headers={"If-None-Match": etag})
+        if cached.status_code != 304 or cached.content or cached.headers.get("ETag") != etag:
+            print(f"{Colors.RED}✗{Colors.RESET} {path} → atteso 304 vuoto, ricevuto {cached.status_code}")
+            return False
+        stale = await client.get(path, params=params, headers={"If-None-Match": '"obsoleto"'})
+        if stale.status_code != 200:
+            print(f"{Colors.RED}✗{Colors.RESET} {path} → ETag diverso, ricevuto {stale.status_code}")
+            return False
+        print(f"{Colors.GREEN}✓{Colors.RESET} {path} → 304 con {etag}, 200 con ETag diverso")
+    
+    return True
+
+async def test_products_batch(client: httpx.AsyncClient) -> bool:
+    """Test batch lookup order, missing ids and fields= projections"""
+    print(f"\n{Colors.BLUE}Testing Batch Prodotti:{Colors.RESET}")
+    
+    listing = await client.get("/api/products", params={"limit": 3})
+    ids = [product["id"] for product in listing.json()]
+    requested = [ids[2], "inesistente", ids[0], ids[2], ids[1]]
+    response = await client.post("/api/products/batch", json={"ids": requested, "fields": "card"})
+    if response.status_code != 200:
+        print(f"{Colors.RED}✗{Colors.RESET} Batch non disponibile ({response.status_code})")
+        return False
+    batch = response.json()
+    returned = [product["id"] for product in batch["products"]]
+    if returned != [ids[2], ids[0], ids[1]] or batch["missing"] != ["inesistente"]:
+        print(f"{Colors.RED}✗{Colors.RESET} Ordine errato: {returned}, mancanti {batch['missing']}")
+        return False
+    if any("variants" in product or "name" not in product for product in batch["products"]):
+        print(f"{Colors.RED}✗{Colors.RESET} Proiezione 'card' non applicata")
+        return False
+    print(f"{Colors.GREEN}✓{Colors.RESET} {len(returned)} prodotti in ordine di richiesta, mancanti {batch['missing']}")
+    
+    for label, request in (
+        ("batch", client.post("/api/products/batch", json={"ids": ids, "fields": "bogus"})),
+        ("lista", client.get("/api/products", params={"fields": "bogus"})),
+        ("dettaglio", client.get(f"/api/products/{ids[0]}", params={"fields": "name,bogus"})),
+    ):
+        response = await request
+        if response.status_code != 400:
+            print(f"{Colors.RED}✗{Colors.RESET} {label}: campo sconosciuto → {response.status_code}, atteso 400")
+            return False
+    print(f"{Colors.GREEN}✓{Colors.RESET} Campi sconosciuti rifiutati con 400")
+    
+    return True
+
 async def test_product_variants(client: httpx.AsyncClient) -> bool:
     """Test product variants (size/color)"""
     print(f"\n{Colors.BLUE}Testing Product Variants:{Colors.RESET}")
@@ -381,6 +491,10 @@ async def main():
         # Run all tests
         results.append(await test_italian_search(client))
         results.append(await test_fashion_catalog(client))
+        results.append(await test_pagination(client))
+        results.append(await test_facets(client))
+        results.append(await test_conditional_get(client))
+        results.append(await test_products_batch(client))
         results.append(await test_product_variants(client))
         results.append(await test_cart_with_variants(client))
         results.append(await test_recommendations(client))
@@ -0,0 +1,68 @@
+"""Multi-pattern phrase matching shared by search normalization and intent detection."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+_END = ""
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Render a character trie as a regex that prefers the longest phrase."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != _END
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and _END not in node:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if _END in node else body
+
+
+class PhraseMatcher:
+    """Trie of ``phrase -> value`` pairs compiled into one regular expression.
+
+    Every phrase is found in a single left-to-right pass over the text (run by
+    the C regex engine), so the cost no longer grows with the number of
+    synonyms. Branches of the trie are greedy, which gives leftmost-longest
+    semantics: "felpa con cappuccio" wins over "felpa".
+    """
+
+    def __init__(self, phrases: Mapping[str, str]) -> None:
+        self._values: Dict[str, str] = {p: v for p, v in phrases.items() if p}
+        trie: Dict[str, Any] = {}
+        for phrase in self._values:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+        self._pattern = re.compile(_trie_pattern(trie)) if trie else None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """Non-overlapping ``(start, end, phrase)`` matches, leftmost-longest."""
+        if self._pattern is None:
+            return []
+        return [(m.start(), m.end(), m.group()) for m in self._pattern.finditer(text)]
+
+    def replace(self, text: str) -> str:
+        """Replace every matched phrase with its mapped value."""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(lambda m: self._values[m.group()], text)
+
+    def longest_match(self, text: str) -> Optional[Tuple[str, str]]:
+        """Return ``(value, phrase)`` for the longest phrase in ``text``."""
+        best: Optional[str] = None
+        for _, _, phrase in self.find(text):
+            if best is None or len(phrase) > len(best):
+                best = phrase
+        if best is None:
+            return None
+        return self._values[best], best
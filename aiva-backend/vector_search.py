@@ -0,0 +1,162 @@
+"""Offline vector similarity over product text: sparse hashed TF-IDF in NumPy."""
+
+from __future__ import annotations
+
+import math
+import zlib
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+VECTOR_DIMENSIONS = 1024
+# Products vectorized per batch while building the matrix
+_BATCH = 4096
+
+
+@lru_cache(maxsize=65536)
+def _word_features(word: str, dimensions: int) -> Tuple[Tuple[int, ...], Tuple[float, ...]]:
+    """Hashed ``(dimensions, signs)`` of a word and its padded character trigrams.
+
+    The sign is taken from another bit of the same hash, so colliding
+    features tend to cancel out instead of piling up (signed feature hashing).
+    """
+    padded = f" {word} "
+    features = [f"w:{word}"] + [padded[i : i + 3] for i in range(len(padded) - 2)]
+    columns: List[int] = []
+    signs: List[float] = []
+    for feature in features:
+        digest = zlib.crc32(feature.encode("utf-8"))
+        columns.append(digest % dimensions)
+        signs.append(-1.0 if digest >> 31 else 1.0)
+    return tuple(columns), tuple(signs)
+
+
+class VectorIndex:
+    """L2-normalized hashed TF-IDF vectors, one row per catalog position.
+
+    Documents are raw product texts (accents and punctuation stripped, but
+    synonyms not folded), so brand words keep their own features. Each word
+    contributes itself plus its character trigrams, which makes the vectors
+    tolerant to typos and partial words ("felpaa", "giubbott").
+
+    A product has well under a hundred non-zero features, so the rows are
+    stored sparse (CSR: ``data``/``columns`` per row between ``indptr``
+    bounds), about half a kilobyte per product instead of a dense row of
+    ``dimensions`` floats. A query is a sparse matrix-vector product followed
+    by an ``argpartition`` top-k; nothing is downloaded or trained.
+    """
+
+    def __init__(self, texts: Sequence[str], dimensions: int = VECTOR_DIMENSIONS) -> None:
+        self.dimensions = dimensions
+        data: List[np.ndarray] = []
+        columns: List[np.ndarray] = []
+        row_counts: List[np.ndarray] = []
+        for start in range(0, len(texts), _BATCH):
+            counts = self._counts(texts[start : start + _BATCH])
+            rows, cols = np.nonzero(counts)
+            data.append(counts[rows, cols].astype(np.float32))
+            columns.append(cols.astype(np.int16 if dimensions <= 1 << 15 else np.int32))
+            row_counts.append(np.bincount(rows, minlength=len(counts)))
+
+        self.data = np.concatenate(data) if data else np.zeros(0, dtype=np.float32)
+        self.columns = np.concatenate(columns) if columns else np.zeros(0, dtype=np.int16)
+        self.indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+        if row_counts:
+            np.cumsum(np.concatenate(row_counts), out=self.indptr[1:])
+
+        document_frequency = np.bincount(self.columns, minlength=dimensions)
+        self.idf = (
+            np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+        ).astype(np.float32)
+        self.data *= self.idf[self.columns]
+        norms = np.sqrt(self._row_sums(self.data * self.data))
+        self.data /= np.repeat(np.where(norms > 0, norms, 1), np.diff(self.indptr)).astype(
+            np.float32
+        )
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def _row_sums(self, values: np.ndarray) -> np.ndarray:
+        """Per-row sums of values aligned with ``data`` (0 for empty rows)."""
+        # reduceat needs in-range starts, so pad with a trailing zero; empty
+        # rows would otherwise repeat the next row's first value
+        sums = np.add.reduceat(np.append(values, 0), self.indptr[:-1])
+        sums[self.indptr[:-1] == self.indptr[1:]] = 0
+        return sums
+
+    def _scores(self, query: np.ndarray) -> np.ndarray:
+        """Cosine of every row with a normalized dense ``query``."""
+        return self._row_sums(self.data * query[self.columns])
+
+    def _counts(self, texts: Iterable[str]) -> np.ndarray:
+        """Signed hashed feature counts for a batch of texts."""
+        rows: List[int] = []
+        columns: List[int] = []
+        values: List[float] = []
+        count = 0
+        for row, text in enumerate(texts):
+            count = row + 1
+            for word in text.split():
+                word_columns, signs = _word_features(word, self.dimensions)
+                rows.extend([row] * len(word_columns))
+                columns.extend(word_columns)
+                values.extend(signs)
+        flat = np.array(rows, dtype=np.int64) * self.dimensions + np.array(columns, dtype=np.int64)
+        counts = np.bincount(flat, weights=values, minlength=count * self.dimensions)
+        return counts.reshape(count, self.dimensions)
+
+    def vectorize(self, text: str) -> np.ndarray:
+        """Normalized query vector for ``text`` (all zeros if it has no words)."""
+        vector = self._counts([text])[0].astype(np.float32) * self.idf
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _top(
+        self,
+        scores: np.ndarray,
+        limit: Optional[int],
+        accept: Optional[np.ndarray],
+        min_score: float) -> List[Tuple[int, float]]:
+        keep = scores >= min_score
+        if accept is not None:
+            keep &= accept
+        candidates = np.flatnonzero(keep)
+        if limit is not None and len(candidates) > limit:
+            if limit <= 0:
+                return []
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # Best score first, ties in catalog order
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(int(position), float(scores[position])) for position in candidates]
+
+    def search(
+        self,
+        text: str,
+        limit: Optional[int] = 10,
+        accept: Optional[np.ndarray] = None,
+        min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """``(position, cosine)`` of the products closest to ``text``, best first.
+
+        ``accept`` is an optional boolean mask over positions (the compiled
+        search filters); scores below ``min_score`` are dropped.
+        """
+        query = self.vectorize(text)
+        if not query.any():
+            return []
+        return self._top(self._scores(query), limit, accept, max(min_score, 1e-6))
+
+    def similar(
+        self,
+        position: int,
+        limit: Optional[int] = 10,
+        accept: Optional[np.ndarray] = None,
+        min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """Products most similar to the one at ``position`` ("more like this")."""
+        start, end = self.indptr[position], self.indptr[position + 1]
+        query = np.zeros(self.dimensions, dtype=np.float32)
+        query[self.columns[start:end]] = self.data[start:end]
+        scores = self._scores(query)
+        scores[position] = -math.inf
+        return self._top(scores, limit, accept, min_score)
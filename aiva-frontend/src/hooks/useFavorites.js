@@ -1,22 +1,48 @@
 // src/hooks/useFavorites.js - Favorites Management Hook
 import { useState, useEffect, useCallback } from 'react';
 import useStore from '../store';
+import { productAPI } from '../services/api';
 
 export const useFavorites = () => {
   const [favorites, setFavorites] = useState([]);
   const [loading, setLoading] = useState(false);
 
-  // Load favorites from localStorage on mount
+  // Load favorites from localStorage on mount, then refresh prices and
+  // discounts in one batch request (dropping products no longer in catalog)
   useEffect(() => {
     const savedFavorites = localStorage.getItem('aiva-favorites');
-    if (savedFavorites) {
-      try {
-        setFavorites(JSON.parse(savedFavorites));
-      } catch (error) {
-        console.error('Error loading favorites:', error);
-        setFavorites([]);
-      }
+    if (!savedFavorites) return;
+
+    let saved;
+    try {
+      saved = JSON.parse(savedFavorites);
+    } catch (error) {
+      console.error('Error loading favorites:', error);
+      setFavorites([]);
+      return;
     }
+    setFavorites(saved);
+    if (!Array.isArray(saved) || saved.length === 0) return;
+
+    let cancelled = false;
+    setLoading(true);
+    productAPI
+      .getProductsBatch(saved.map(fav => fav.id), 'card')
+      .then(({ products, missing }) => {
+        if (cancelled) return;
+        const fresh = new Map(products.map(product => [product.id, product]));
+        const gone = new Set(missing);
+        setFavorites(prev => prev
+          .filter(fav => !gone.has(fav.id))
+          .map(fav => (fresh.has(fav.id) ? { ...fav, ...fresh.get(fav.id) } : fav)));
+      })
+      .catch(error => console.error('Error refreshing favorites:', error))
+      .finally(() => {
+        if (!cancelled) setLoading(false);
+      });
+    return () => {
+      cancelled = true;
+    };
   }, []);
 
   // Save favorites to localStorage whenever favorites change
@@ -104,7 +104,7 @@ const OffersPage = () => {
         setError(null);
         
         // Load products that are on sale
-        const productsData = await productAPI.getProducts({ on_sale: true });
+        const productsData = await productAPI.getProducts({ on_sale: true, sort: 'discount' });
         
         // Transform products to offers format
         const offersData = productsData.map((product, index) => ({
@@ -17,6 +17,9 @@ const deriveApiBase = () => {
 const API_BASE = deriveApiBase();
 const API_ROOT = API_BASE.replace(/\/api$/, '');
 
+// Most ids the backend resolves per /products/batch request (PRODUCT_BATCH_LIMIT)
+export const PRODUCT_BATCH_LIMIT = 100;
+
 const buildApiUrl = (endpoint = '') => {
   if (!endpoint) return API_BASE;
   if (endpoint.startsWith('http')) return endpoint;
@@ -80,6 +83,31 @@ export const productAPI = {
     return res.json();
   },
 
+  // Longer id lists are split into PRODUCT_BATCH_LIMIT-sized requests and
+  // their results merged, in request order
+  async getProductsBatch(ids, fields) {
+    const chunks = [];
+    for (let start = 0; start < ids.length; start += PRODUCT_BATCH_LIMIT) {
+      chunks.push(ids.slice(start, start + PRODUCT_BATCH_LIMIT));
+    }
+    const responses = await Promise.all(chunks.map(async chunk => {
+      const res = await fetch(
+        `${API_BASE}/products/batch`,
+        withSessionHeaders({
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ ids: chunk, fields }),
+        })
+      );
+      if (!res.ok) throw new Error(`POST /products/batch ${res.status}`);
+      return res.json();
+    }));
+    return {
+      products: responses.flatMap(response => response.products),
+      missing: responses.flatMap(response => response.missing),
+    };
+  },
+
   async checkAvailability(productId, size, color) {
     const qs = new URLSearchParams({ size, color });
     const res = await fetch(